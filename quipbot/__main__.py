@@ -4,10 +4,6 @@
 import os
 import sys
 import argparse
-import yaml
-import signal
-import atexit
-from .core.irc import IRCBot
 
 def parse_args():
     """Parse command line arguments."""
@@ -19,59 +15,74 @@ def parse_args():
                       help='Do not fork to background (run in foreground)')
     parser.add_argument('-c', '--config', default='config.yaml',
                       help='Path to config file (default: config.yaml)')
+    parser.add_argument('--daemon-child', action='store_true',
+                      help=argparse.SUPPRESS)
+    parser.add_argument('--ready-fd', type=int, default=None,
+                      help=argparse.SUPPRESS)
     return parser.parse_args()
 
-def daemonize(pid_file):
-    """Fork the process to the background and write PID file."""
-    # Store the working directory
-    working_dir = os.getcwd()
-
-    # First fork (detaches from parent)
-    try:
-        pid = os.fork()
-        if pid > 0:
-            # Parent process exits
-            sys.exit(0)
-    except OSError as err:
-        sys.stderr.write(f'fork #1 failed: {err}\n')
-        sys.exit(1)
+def spawn_daemon(args):
+    """Detach by starting the bot in a fresh interpreter and new session.
+    
+    The current process is never forked, so its address space is not
+    copied. The spawned interpreter is started with --daemon-child, writes
+    its own PID file and keeps our stderr until it reports back over a
+    pipe, so startup errors still reach the terminal.
     
-    # Decouple from parent environment
-    os.setsid()
-    os.umask(0)
+    Returns:
+        bool: True once the child reported a successful startup
+    """
+    import subprocess
+    
+    sys.stdout.flush()
+    sys.stderr.flush()
     
-    # Second fork (relinquish session leadership)
+    read_fd, write_fd = os.pipe()
     try:
-        pid = os.fork()
-        if pid > 0:
-            # Parent process exits
-            sys.exit(0)
-    except OSError as err:
-        sys.stderr.write(f'fork #2 failed: {err}\n')
-        sys.exit(1)
+        child = subprocess.Popen(
+            [sys.executable, '-m', 'quipbot', '--no-fork', '--daemon-child',
+             '--ready-fd', str(write_fd), '-c', args.config],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            pass_fds=(write_fd,),
+            start_new_session=True
+        )
+    finally:
+        os.close(write_fd)
+    
+    # Blocks until the child reports or exits, EOF without a report means it failed
+    with os.fdopen(read_fd, 'rb') as ready:
+        status = ready.read()
+    if status == b'ok':
+        return True
+    
+    returncode = child.wait()
+    sys.stderr.write(f'Bot failed to start (exit status {returncode})\n')
+    return False
+
+def notify_ready(ready_fd):
+    """Tell the parent in spawn_daemon() that startup succeeded.
     
-    # Change to the original working directory
-    os.chdir(working_dir)
+    stderr is switched to /dev/null first, so the daemon no longer holds
+    on to the terminal once the parent exits.
+    """
+    sys.stderr.flush()
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, sys.stderr.fileno())
+    os.close(devnull)
+    
+    os.write(ready_fd, b'ok')
+    os.close(ready_fd)
+
+def write_pid(pid_file):
+    """Write the current PID to pid_file and remove it on exit."""
+    import atexit
     
-    # Write pidfile before redirecting outputs
-    pid = str(os.getpid())
     with open(pid_file, 'w+') as f:
-        f.write(pid + '\n')
+        f.write(f"{os.getpid()}\n")
     
     # Register cleanup function
     atexit.register(cleanup_pid, pid_file)
-    
-    # Flush standard file descriptors
-    sys.stdout.flush()
-    sys.stderr.flush()
-    
-    # Replace file descriptors for stdin, stdout, and stderr
-    with open(os.devnull, 'r') as f:
-        os.dup2(f.fileno(), sys.stdin.fileno())
-    with open(os.devnull, 'a+') as f:
-        os.dup2(f.fileno(), sys.stdout.fileno())
-    with open(os.devnull, 'a+') as f:
-        os.dup2(f.fileno(), sys.stderr.fileno())
 
 def cleanup_pid(pid_file):
     """Remove PID file on exit."""
@@ -83,9 +94,11 @@ def main():
     args = parse_args()
     
     # Load config file
+    from .utils.config import load_config, get_config_stat
     try:
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
+        # Stat before parsing so an edit made in between is seen by !rehash
+        config_stat = get_config_stat(args.config)
+        config = load_config(args.config)
     except Exception as e:
         sys.stderr.write(f'Error loading config file: {e}\n')
         sys.exit(1)
@@ -93,24 +106,41 @@ def main():
     # Get PID file path from config
     pid_file = config.get('pid_file', '/tmp/quipbot.pid')
     
-    # Fork to background unless --no-fork is specified
-    if not args.no_fork:
-        try:
-            daemonize(pid_file)
-        except Exception as e:
-            sys.stderr.write(f'Error daemonizing: {e}\n')
-            sys.exit(1)
+    # Set up signal handlers before detaching so the bot is never without
+    # them. The PID file itself is removed by the atexit hook registered
+    # in write_pid(), which also runs on sys.exit().
+    import signal
     
-    # Set up signal handlers
     def signal_handler(signum, frame):
-        cleanup_pid(pid_file)
         sys.exit(0)
     
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
+    # Ignore terminal hangups until the bot installs its rehash handler
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    
+    # Detach to background unless --no-fork is specified
+    if args.daemon_child:
+        # Already detached by spawn_daemon(), just record our PID
+        os.umask(0)
+        write_pid(pid_file)
+    elif not args.no_fork:
+        try:
+            started = spawn_daemon(args)
+        except Exception as e:
+            sys.stderr.write(f'Error daemonizing: {e}\n')
+            sys.exit(1)
+        sys.exit(0 if started else 1)
+    
+    # Only imported once detached, the child's import errors still reach
+    # the terminal through spawn_daemon()
+    from .core.irc import IRCBot
     
     # Create and run the bot
-    bot = IRCBot(config, config_file=args.config)
+    bot = IRCBot(config, config_file=args.config, config_stat=config_stat)
+    if args.ready_fd is not None:
+        notify_ready(args.ready_fd)
     bot.run()
 
 if __name__ == '__main__':
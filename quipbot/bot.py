@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 """QuipBot - A sarcastic IRC bot."""
 
-import yaml
 from quipbot.core.irc import IRCBot
+from quipbot.utils.config import load_config
 from quipbot.utils.logger import setup_logger
 
 def main():
     """Main entry point."""
     # Load configuration
-    with open('config.yaml', 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_config('config.yaml')
 
     # Set up logging
     logger = setup_logger('QuipBot', config)
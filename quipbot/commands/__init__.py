@@ -1,16 +1,28 @@
 """Command system for QuipBot."""
 
 from abc import ABC, abstractmethod
-import os
+import sys
 import importlib
-import inspect
 import logging
 from typing import Dict, Type
-from pathlib import Path
 
 logger = logging.getLogger('QuipBot')
 
+# Formatted help text keyed by (command name, prefix)
+_help_cache = {}
+
 class Command(ABC):
+    # Command name, set as a class attribute by each subclass
+    name = None
+    # Optional help text with a {prefix} placeholder, see format_help()
+    help_template = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Ensure every command class declares its name."""
+        super().__init_subclass__(**kwargs)
+        if not isinstance(cls.name, str):
+            raise TypeError(f"{cls.__name__} must define a 'name' class attribute")
+
     def __init__(self, bot):
         """Initialize command with bot instance."""
         self.bot = bot
@@ -22,12 +34,6 @@ class Command(ABC):
         """Execute the command."""
         pass
 
-    @property
-    @abstractmethod
-    def name(self):
-        """Command name."""
-        pass
-
     @property
     @abstractmethod
     def help(self):
@@ -50,47 +56,66 @@ class Command(ABC):
         """
         return self.bot.get_channel_config(channel, 'cmd_prefix', '!')
 
+    def format_help(self, channel=None):
+        """Fill in help_template with the command prefix.
+        
+        The formatted text is memoized per (command, prefix), so a prefix
+        change after a rehash simply produces a new entry.
+        
+        Args:
+            channel: Optional channel name. If None, uses global default.
+            
+        Returns:
+            str: The formatted help text
+        """
+        prefix = self.get_prefix(channel)
+        key = (self.name, prefix)
+        text = _help_cache.get(key)
+        if text is None:
+            text = self.help_template.format(prefix=prefix)
+            _help_cache[key] = text
+        return text
+
+# Command registry as (module, class name) pairs. Classes are resolved
+# through sys.modules on every load so that a hot reload picks up the
+# freshly reloaded command classes.
+COMMAND_REGISTRY = (
+    ('boot', 'BootCommand'),
+    ('config', 'ConfigCommand'),
+    ('die', 'DieCommand'),
+    ('help', 'HelpCommand'),
+    ('info', 'InfoCommand'),
+    ('jump', 'JumpCommand'),
+    ('kick', 'KickCommand'),
+    ('rehash', 'RehashCommand'),
+    ('reload', 'ReloadCommand'),
+    ('say', 'SayCommand'),
+    ('sleep', 'SleepCommand'),
+    ('topic', 'TopicCommand'),
+    ('var', 'VarCommand'),
+    ('wake', 'WakeCommand'),
+)
+
 def load_commands() -> Dict[str, Type[Command]]:
-    """Dynamically load all command classes.
+    """Load all registered command classes.
     
     Returns:
         Dict mapping command names to command classes
     """
     commands = {}
-    commands_dir = Path(__file__).parent
     
-    # Load each .py file in the commands directory
-    for file in commands_dir.glob('*.py'):
-        if file.name == '__init__.py':
-            continue
-            
+    for module_stem, class_name in COMMAND_REGISTRY:
         try:
-            # Import the module dynamically
-            module_name = f"quipbot.commands.{file.stem}"
-            module = importlib.import_module(module_name)
+            # Reuse the module if already imported
+            module_name = f"quipbot.commands.{module_stem}"
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
+            obj = getattr(module, class_name)
             
-            # Find Command subclasses in the module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                # Check if class is a Command subclass by checking its bases
-                is_command = False
-                for base in obj.__mro__[1:]:  # Skip the class itself
-                    if base.__name__ == 'Command' and base.__module__ == 'quipbot.commands':
-                        is_command = True
-                        break
+            commands[obj.name] = obj
+            logger.debug(f"Found command: {obj.name}")
                 
-                if (is_command and 
-                    obj.__module__ == module.__name__):  # Only get commands defined in this module
-                    
-                    try:
-                        # Get command name from class property without instantiating
-                        cmd_name = obj.name.fget(None)  # Call the property getter directly with None
-                        commands[cmd_name] = obj
-                        logger.debug(f"Found command: {cmd_name}")
-                    except Exception as e:
-                        logger.error(f"Error getting command name for {name}: {e}", exc_info=True)
-                    
         except Exception as e:
-            logger.error(f"Error loading command module {file.name}: {e}", exc_info=True)
+            logger.error(f"Error loading command {module_stem}.{class_name}: {e}", exc_info=True)
             
     return commands
 
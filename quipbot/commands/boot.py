@@ -1,18 +1,16 @@
 """Command to kick a random user from the channel."""
 
-import random
+from random import choice as _choice
+import logging
 from . import Command
 
 class BootCommand(Command):
-    @property
-    def name(self):
-        return "boot"
+    name = "boot"
+    help_template = "Kick a random user from the channel. Usage: {prefix}boot"
 
     @property
     def help(self):
-        # Get prefix from channel if available, otherwise use global
-        prefix = self.bot.get_channel_config(self.bot.channel if hasattr(self.bot, 'channel') else None, 'cmd_prefix', '!')
-        return f"Kick a random user from the channel. Usage: {prefix}boot"
+        return self.format_help()
 
     def execute(self, nick, channel, args):
         """Execute the boot command."""
@@ -21,41 +19,42 @@ class BootCommand(Command):
         recent_users = self.bot.ai_client.get_recent_users(channel_lower)
         channel_users = self.bot.channel_users.get(channel, {})
         
-        self.bot.logger.debug(f"Recent users in {channel}: {recent_users}")
-        self.bot.logger.debug(f"Channel users in {channel}: {list(channel_users.keys())}")
+        logger = self.bot.logger
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Recent users in {channel}: {recent_users}")
+            logger.debug(f"Channel users in {channel}: {list(channel_users.keys())}")
         
-        # Filter possible targets to only include recent users who are still in channel and not protected
+        # Filter possible targets to only include recent users who are still in channel and not protected.
+        # Cheap checks run first so is_protected_user() is only reached for real candidates.
+        bot_nick_lower = self.bot.current_nick.lower()
         possible_targets = []
         for user in recent_users:
-            if user not in channel_users:  # Skip if not in channel
-                self.bot.logger.debug(f"Skipping {user} - not in channel")
-                continue
-                
-            if channel_users[user].get('op', False):  # Skip if opped
-                self.bot.logger.debug(f"Skipping {user} - is opped")
-                continue
-                
-            if user.lower() == self.bot.current_nick.lower():  # Skip if bot
-                self.bot.logger.debug(f"Skipping {user} - is bot")
-                continue
-                
-            if user == nick:  # Skip if command issuer
-                self.bot.logger.debug(f"Skipping {user} - is command issuer")
-                continue
-                
-            if self.bot.is_protected_user(channel, user):  # Skip if admin
-                self.bot.logger.debug(f"Skipping {user} - is admin/protected")
+            user_info = channel_users.get(user)
+            if user_info is None:  # Skip if not in channel
+                reason = "not in channel"
+            elif user_info.get('op', False):  # Skip if opped
+                reason = "is opped"
+            elif user == nick:  # Skip if command issuer
+                reason = "is command issuer"
+            elif user.lower() == bot_nick_lower:  # Skip if bot
+                reason = "is bot"
+            elif self.bot.is_protected_user(channel, user):  # Skip if admin
+                reason = "is admin/protected"
+            else:
+                possible_targets.append(user)
                 continue
-                
-            possible_targets.append(user)
+            if debug:
+                logger.debug(f"Skipping {user} - {reason}")
         
-        self.bot.logger.debug(f"Possible targets after filtering in {channel}: {possible_targets}")
+        if debug:
+            logger.debug(f"Possible targets after filtering in {channel}: {possible_targets}")
         
         if not possible_targets:
             return "No suitable targets found. Everyone's either too powerful or hasn't spoken recently!"
             
         # Pick a random target
-        target = random.choice(possible_targets)
+        target = _choice(possible_targets)
         self.bot.logger.debug(f"Selected target in {channel}: {target}")
         
         # Get an AI-generated kick reason
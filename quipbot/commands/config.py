@@ -3,11 +3,11 @@
 import pprint
 from .. import commands
 
+# Shared pretty printer for logging config values
+_PP = pprint.PrettyPrinter(indent=2)
+
 class ConfigCommand(commands.Command):
-    @property
-    def name(self):
-        """Command name."""
-        return "config"
+    name = "config"
 
     @property
     def help(self):
@@ -35,8 +35,7 @@ class ConfigCommand(commands.Command):
                 value = value[part]
                 
             # Pretty print the value to log
-            pp = pprint.PrettyPrinter(indent=2)
-            formatted_value = pp.pformat(value)
+            formatted_value = _PP.pformat(value)
             self.bot.logger.info(f"Config variable {var_name} value:\n{formatted_value}")
             
             return f"Printed config {var_name} value to log"
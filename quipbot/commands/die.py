@@ -1,16 +1,13 @@
 """Die command for QuipBot - shuts down the bot."""
 
 import time
-import sys
+import signal
 import threading
 import os
 from .. import commands
 
 class DieCommand(commands.Command):
-    @property
-    def name(self):
-        """Command name."""
-        return "die"
+    name = "die"
 
     @property
     def help(self):
@@ -42,14 +39,11 @@ class DieCommand(commands.Command):
         except:
             pass  # Ignore any errors during shutdown
         
-        # Schedule process exit after 2 seconds
-        def delayed_exit():
-            time.sleep(2)
-            os._exit(0)
-            
-        # Start exit timer in a non-daemon thread
-        exit_thread = threading.Thread(target=delayed_exit)
-        exit_thread.daemon = False
-        exit_thread.start()
+        # Schedule process exit after 2 seconds. The SIGALRM handler
+        # installed by the bot calls os._exit(0).
+        if hasattr(signal, 'setitimer'):
+            signal.setitimer(signal.ITIMER_REAL, 2.0)
+        else:
+            threading.Timer(2.0, os._exit, args=(0,)).start()
         
         return None  # No response needed since we're quitting 
\ No newline at end of file
@@ -3,16 +3,20 @@
 from . import Command
 
 class HelpCommand(Command):
-    @property
-    def name(self):
-        """Command name."""
-        return "help"
+    name = "help"
+    help_template = "Display help for commands. Usage: {prefix}help [command]"
+
+    def __init__(self, bot):
+        """Initialize help command."""
+        super().__init__(bot)
+        # {(channel, permission flags): joined command names}, valid for _cache_config
+        self._available_cache = {}
+        self._cache_config = None
 
     @property
     def help(self):
         """Command help."""
-        prefix = self.bot.get_channel_config(None, 'cmd_prefix', '!')
-        return f"Display help for commands. Usage: {prefix}help [command]"
+        return self.format_help()
 
     @property
     def usage(self):
@@ -24,6 +28,29 @@ class HelpCommand(Command):
         prefix = self.bot.get_channel_config(channel, 'cmd_prefix', '!')
         return f"{prefix}{cmd.usage} - {cmd.help}"
 
+    def _available_commands(self, channel, permissions):
+        """Get the comma-separated command names a set of permission flags allows in a channel.
+        
+        Results are memoized per (channel, flags) and dropped whenever the
+        bot's config object is replaced by a rehash or reload.
+        """
+        if self._cache_config is not self.bot.config:
+            self._available_cache.clear()
+            self._cache_config = self.bot.config
+            
+        key = (channel.lower(), permissions)
+        available = self._available_cache.get(key)
+        if available is None:
+            handler = self.bot.handler
+            # command_names is already sorted, so filtering keeps the order
+            available = ', '.join([
+                cmd_name for cmd_name in handler.command_names
+                if handler._permits(permissions, channel,
+                                    self.bot.get_channel_command_config(channel, cmd_name))
+            ])
+            self._available_cache[key] = available
+        return available
+
     def execute(self, nick, channel, args):
         """Execute help command."""
         try:
@@ -39,15 +66,10 @@ class HelpCommand(Command):
                     return f"Unknown command: {command_name}"
             else:
                 # Get list of available commands for this user
-                available_commands = []
-                for cmd_name, cmd in self.bot.handler.commands.items():
-                    # Get command config
-                    cmd_config = self.bot.get_channel_command_config(channel, cmd_name)
-                    # Check if user has permission to use this command
-                    if self.bot.handler._check_command_permissions(nick, channel, cmd_config):
-                        available_commands.append(cmd_name)
+                permissions = self.bot.handler._get_user_permissions(nick, channel)
+                available_commands = self._available_commands(channel, permissions)
                 
-                return f"Available commands: {', '.join(sorted(available_commands))} - For details, use: {prefix}help <command>"
+                return f"Available commands: {available_commands} - For details, use: {prefix}help <command>"
                 
         except Exception as e:
             self.bot.logger.error(f"Error in help command: {e}", exc_info=True)
@@ -1,142 +1,164 @@
 """Info command for QuipBot - displays key behavioral configuration settings."""
 
+from functools import lru_cache
 from . import Command
 
+@lru_cache(maxsize=32)
+def _format_delay(start, end):
+    """Format an ai_delay range without trailing .0, accepting ints or floats."""
+    start = int(start) if float(start).is_integer() else start
+    end = int(end) if float(end).is_integer() else end
+    return f"{start}-{end}"
+
+def _format_duration(seconds):
+    """Format a duration in whole minutes from 60 seconds up, otherwise in seconds."""
+    if seconds >= 60:
+        return f"**{seconds // 60}** mins"
+    return f"**{seconds}** secs"
+
 class InfoCommand(Command):
-    @property
-    def name(self):
-        return "info"
+    name = "info"
+    help_template = "Display bot behavioral settings. Usage: {prefix}info"
+
+    # (config key, label) for each kind of AI context, in display order
+    _CONTEXT_KEYS = (
+        ('ai_context_direct', 'direct'),
+        ('ai_context_mention', 'mentions'),
+        ('ai_context_idle', 'idle'),
+        ('ai_context_topic', 'topics'),
+    )
+
+    def __init__(self, bot):
+        """Initialize info command."""
+        super().__init__(bot)
+        # {channel: info lines}, valid for _cache_config
+        self._lines_cache = {}
+        self._cache_config = None
 
     @property
     def help(self):
-        prefix = self.get_prefix()
-        return f"Display bot behavioral settings. Usage: {prefix}info"
-
-    def execute(self, nick, channel, args):
-        """Execute info command."""
-        try:
-            # Build response parts
-            lines = []
+        return self.format_help()
 
-            # Line 1: AI service info and command prefix
-            ai_service = self.bot.get_channel_config(channel, 'ai_service', 'openai')
-            ai_model = self.bot.get_channel_config(channel, 'ai_model', 'gpt-4o-mini')
-            prefix = self.get_prefix(channel)
-            lines.append(f"🤖 **QuipBot** v2.0 | ⚡ Prefix: **{prefix}** | 🎯 **AI**: Using **{ai_service}** with model **{ai_model}**")
+    def _build_lines(self, channel):
+        """Build the info lines for a channel from its current config.
+        
+        The lines only depend on the config, so execute() caches them per
+        channel until a rehash or reload replaces the config.
+        
+        Args:
+            channel: The channel to describe
             
-            # Line 2: Group behavior settings
-            behavior_parts = []
-            if self.bot.get_channel_config(channel, 'ai_entrance', False):
-                behavior_parts.append("entrance messages")
-            idle_chat_interval = self.bot.get_channel_config(channel, 'idle_chat_interval', 0)
-            idle_chat_time = self.bot.get_channel_config(channel, 'idle_chat_time', 0)
-            if idle_chat_interval and idle_chat_time:
-                # Convert to minutes if > 60 seconds
-                if idle_chat_interval >= 60:
-                    interval_str = f"**{idle_chat_interval // 60}** mins"
-                else:
-                    interval_str = f"**{idle_chat_interval}** secs"
-                if idle_chat_time >= 60:
-                    time_str = f"**{idle_chat_time // 60}** mins"
-                else:
-                    time_str = f"**{idle_chat_time}** secs"
-                behavior_parts.append(f"idle chat every {interval_str} after {time_str} silence")
+        Returns:
+            list: Lines to send, empty if nothing is enabled
+        """
+        # Build response parts
+        lines = []
+        cfg = self.bot.get_merged_channel_config(channel)
 
-            random_action_interval = self.bot.get_channel_config(channel, 'random_action_interval', 0)
-            if random_action_interval:
-                if random_action_interval >= 60:
-                    interval_str = f"**{random_action_interval // 60}** mins"
-                else:
-                    interval_str = f"**{random_action_interval}** secs"
-                    
-                # Get global and channel random actions
-                global_actions = self.bot.config.get('random_actions', {})
-                channel_config = next(
-                    (c for c in self.bot.channels if c['name'].lower() == channel.lower()),
-                    None
-                )
-                channel_actions = channel_config.get('random_actions', {}) if channel_config else {}
-                
-                # Combine enabled actions from both global and channel settings
-                enabled_actions = []
-                for action in set(global_actions.keys()) | set(channel_actions.keys()):
-                    # Action is enabled if it's enabled in channel settings (if present) or global settings
-                    if channel_actions.get(action, global_actions.get(action, False)):
-                        enabled_actions.append(action)
-                
-                if enabled_actions:
-                    actions_str = ", ".join(f"**{action}**" for action in sorted(enabled_actions))
-                    # Get idle time requirement for random actions
-                    idle_time = self.bot.get_channel_config(channel, 'idle_chat_time', random_action_interval)
-                    if idle_time >= 60:
-                        idle_str = f" after **{idle_time // 60}** mins silence"
-                    else:
-                        idle_str = f" after **{idle_time}** secs silence"
-                    behavior_parts.append(f"random actions ({actions_str}) every {interval_str}{idle_str}")
-                else:
-                    behavior_parts.append("no random actions")
-            
-            if behavior_parts:
-                lines.append("🎭 **Behaviour**: " + " | ".join(behavior_parts))
-            
-            # Line 3: Interaction settings
-            interaction_parts = []
-            
-            # Bot mentions and conversation continuation
-            ai_mention = self.bot.get_channel_config(channel, 'ai_mention', False)
-            ai_continue = self.bot.get_channel_config(channel, 'ai_continue', False)
-            ai_continue_freq = self.bot.get_channel_config(channel, 'ai_continue_freq', 0)
-            ai_continue_mins = self.bot.get_channel_config(channel, 'ai_continue_mins', 0)
-            if ai_mention and ai_continue and ai_continue_freq and ai_continue_mins:
-                if ai_continue_freq >= 60:
-                    freq_str = f"**{ai_continue_freq // 60}** mins"
-                else:
-                    freq_str = f"**{ai_continue_freq}** secs"
-                interaction_parts.append(f"continue chat every {freq_str} for **{ai_continue_mins}** mins after last mention")
-            
-            # Sleep settings
-            sleep_max = self.bot.get_channel_config(channel, 'sleep_max', 0)
-            if sleep_max:
-                interaction_parts.append(f"sleep for up to **{sleep_max}** mins")
-            
-            # Response delay
-            ai_delay = self.bot.get_channel_config(channel, 'ai_delay', [0, 0])
-            if isinstance(ai_delay, list) and len(ai_delay) == 2:
-                # Format delay values without .0
-                delay_start = int(ai_delay[0]) if ai_delay[0].is_integer() else ai_delay[0]
-                delay_end = int(ai_delay[1]) if ai_delay[1].is_integer() else ai_delay[1]
-                interaction_parts.append(f"response delay **{delay_start}-{delay_end}** secs")
-            
-            if interaction_parts:
-                lines.append("💭 **Interaction**: " + " | ".join(interaction_parts))
+        # Line 1: AI service info and command prefix
+        ai_service = cfg.get('ai_service', 'openai')
+        ai_model = cfg.get('ai_model', 'gpt-4o-mini')
+        prefix = self.get_prefix(channel)
+        lines.append(f"🤖 **QuipBot** v2.0 | ⚡ Prefix: **{prefix}** | 🎯 **AI**: Using **{ai_service}** with model **{ai_model}**")
+        
+        # Line 2: Group behavior settings
+        behavior_parts = []
+        if cfg.get('ai_entrance', False):
+            behavior_parts.append("entrance messages")
+        idle_chat_interval = cfg.get('idle_chat_interval', 0)
+        idle_chat_time = cfg.get('idle_chat_time', 0)
+        if idle_chat_interval and idle_chat_time:
+            behavior_parts.append(
+                f"idle chat every {_format_duration(idle_chat_interval)} after {_format_duration(idle_chat_time)} silence"
+            )
 
-            # Line 4: Context settings
-            context_types = []
-            if self.bot.get_channel_config(channel, 'ai_context_direct', False):
-                context_types.append("direct")
-            if self.bot.get_channel_config(channel, 'ai_context_mention', False):
-                context_types.append("mentions")
-            if self.bot.get_channel_config(channel, 'ai_context_idle', False):
-                context_types.append("idle")
-            if self.bot.get_channel_config(channel, 'ai_context_topic', False):
-                context_types.append("topics")
+        random_action_interval = cfg.get('random_action_interval', 0)
+        if random_action_interval:
+            interval_str = _format_duration(random_action_interval)
+                
+            # Get global and channel random actions
+            global_actions = self.bot.config.get('random_actions', {})
+            channel_config = self.bot.channels_by_name.get(channel.lower())
+            channel_actions = channel_config.get('random_actions', {}) if channel_config else {}
             
-            chat_history = self.bot.get_channel_config(channel, 'chat_history', 0)
-            if context_types and chat_history:
-                context_info = f"📝 **Context**: last **{chat_history}** chat lines for " + ", ".join(context_types)
-                if self.bot.get_channel_config(channel, 'ai_nicklist', False):
-                    context_info += ". Nicklist is included."
-                lines.append(context_info)
+            # Combine enabled actions from both global and channel settings
+            enabled_actions = []
+            for action in set(global_actions.keys()) | set(channel_actions.keys()):
+                # Action is enabled if it's enabled in channel settings (if present) or global settings
+                if channel_actions.get(action, global_actions.get(action, False)):
+                    enabled_actions.append(action)
             
-            # Return list of lines for the bot to send separately
-            if lines:
-                # Send each line as a separate message, but don't add to chat history
-                for line in lines:
-                    self.bot.send_channel_message(channel, line, add_to_history=False)
-                return None  # Return None since we've handled the sending
+            if enabled_actions:
+                actions_str = ", ".join(f"**{action}**" for action in sorted(enabled_actions))
+                # Get idle time requirement for random actions
+                idle_time = cfg.get('idle_chat_time', random_action_interval)
+                behavior_parts.append(
+                    f"random actions ({actions_str}) every {interval_str} after {_format_duration(idle_time)} silence"
+                )
             else:
-                return "No behavioral settings are currently enabled."
+                behavior_parts.append("no random actions")
+        
+        if behavior_parts:
+            lines.append("🎭 **Behaviour**: " + " | ".join(behavior_parts))
+        
+        # Line 3: Interaction settings
+        interaction_parts = []
+        
+        # Bot mentions and conversation continuation
+        ai_mention = cfg.get('ai_mention', False)
+        ai_continue = cfg.get('ai_continue', False)
+        ai_continue_freq = cfg.get('ai_continue_freq', 0)
+        ai_continue_mins = cfg.get('ai_continue_mins', 0)
+        if ai_mention and ai_continue and ai_continue_freq and ai_continue_mins:
+            interaction_parts.append(f"continue chat every {_format_duration(ai_continue_freq)} for **{ai_continue_mins}** mins after last mention")
+        
+        # Sleep settings
+        sleep_max = cfg.get('sleep_max', 0)
+        if sleep_max:
+            interaction_parts.append(f"sleep for up to **{sleep_max}** mins")
+        
+        # Response delay
+        ai_delay = self.bot.get_ai_delay_range(channel)
+        if ai_delay:
+            interaction_parts.append(f"response delay **{_format_delay(*ai_delay)}** secs")
+        
+        if interaction_parts:
+            lines.append("💭 **Interaction**: " + " | ".join(interaction_parts))
+
+        # Line 4: Context settings
+        context_types = [label for key, label in self._CONTEXT_KEYS if cfg.get(key, False)]
+        
+        chat_history = cfg.get('chat_history', 0)
+        if context_types and chat_history:
+            context_info = f"📝 **Context**: last **{chat_history}** chat lines for " + ", ".join(context_types)
+            if cfg.get('ai_nicklist', False):
+                context_info += ". Nicklist is included."
+            lines.append(context_info)
+        
+        return lines
+
+    def execute(self, nick, channel, args):
+        """Execute info command."""
+        bot = self.bot
+        if self._cache_config is not bot.config:
+            self._lines_cache.clear()
+            self._cache_config = bot.config
             
-        except Exception as e:
-            self.bot.logger.error(f"Error in info command: {e}", exc_info=True)
-            return f"Error retrieving info: {e}" 
\ No newline at end of file
+        channel_lower = channel.lower()
+        lines = self._lines_cache.get(channel_lower)
+        if lines is None:
+            try:
+                lines = self._build_lines(channel)
+            except (TypeError, ValueError, AttributeError) as e:
+                # A setting has the wrong type in the config file
+                bot.logger.error(f"Error in info command: {e}", exc_info=True)
+                return f"Error retrieving info: {e}"
+            self._lines_cache[channel_lower] = lines
+        
+        # Return list of lines for the bot to send separately
+        if lines:
+            # Send the lines as separate messages in one batch, but don't add to chat history
+            bot.send_channel_messages(channel, lines, add_to_history=False)
+            return None  # Return None since we've handled the sending
+        else:
+            return "No behavioral settings are currently enabled."
@@ -3,10 +3,7 @@
 from .. import commands
 
 class JumpCommand(commands.Command):
-    @property
-    def name(self):
-        """Command name."""
-        return "jump"
+    name = "jump"
 
     @property
     def help(self):
@@ -26,15 +23,10 @@ class JumpCommand(commands.Command):
         
         if target_server:
             # Find the server in the configured servers list
-            server_found = False
-            for i, server in enumerate(self.bot.servers):
-                if server['host'].lower() == target_server.lower():
-                    self.bot.current_server_index = i
-                    server_found = True
-                    break
-            
-            if not server_found:
+            server_index = self.bot.server_index_by_host.get(target_server.lower())
+            if server_index is None:
                 return f"Error: Server '{target_server}' not found in configured servers list."
+            self.bot.current_server_index = server_index
         else:
             # Move to next server in rotation
             self.bot.current_server_index = (self.bot.current_server_index + 1) % len(self.bot.servers)
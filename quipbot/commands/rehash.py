@@ -1,28 +1,38 @@
 """Rehash command for QuipBot - reloads configuration file only."""
 
 from . import Command
-import yaml
 
 class RehashCommand(Command):
-    @property
-    def name(self):
-        return "rehash"
+    name = "rehash"
+    help_template = "Reload the bot configuration file. Usage: {prefix}rehash [force]"
 
     @property
     def help(self):
-        # Get prefix from channel if available, otherwise use global
-        prefix = self.bot.get_channel_config(self.bot.channel if hasattr(self.bot, 'channel') else None, 'cmd_prefix', '!')
-        return f"Reload the bot configuration file. Usage: {prefix}rehash"
+        return self.format_help()
 
     def execute(self, nick, channel, args):
         """Execute the rehash command."""
         try:
+            # Skip the reparse if the file hasn't been touched since it was loaded,
+            # "force" always rereads it in case it was replaced without a visible change
+            force = bool(args) and args[0].lower() == 'force'
+            config_stat = self.bot.get_config_stat()
+            if (not force and config_stat is not None
+                    and config_stat == getattr(self.bot, 'config_stat', None)):
+                self.bot.logger.info(f"Configuration file {self.bot.config_file} unchanged, skipping reload")
+                return f"Configuration unchanged; skipped reload. Use {self.get_prefix(channel)}rehash force to reload anyway."
+                
+            # Only pay for the YAML imports once there is something to parse
+            import yaml
+            from ..utils.config import SafeLoader
+            
             # Reload configuration from original config file
-            with open(self.bot.config_file, 'r') as f:
-                new_config = yaml.safe_load(f)
+            with open(self.bot.config_file, 'rb') as f:
+                new_config = yaml.load(f.read(), Loader=SafeLoader)
                 
             # Update configuration
             self.bot.update_config(new_config)
+            self.bot.config_stat = config_stat
             
             self.bot.logger.info(f"Successfully reloaded configuration from {self.bot.config_file}")
             return "Configuration reloaded successfully."
@@ -2,22 +2,24 @@
 
 from . import Command
 from ..utils.reloader import ModuleReloader
-import yaml
 
 class ReloadCommand(Command):
-    @property
-    def name(self):
-        return "reload"
+    name = "reload"
+    help_template = "Reload both configuration and code modules. Usage: {prefix}reload"
 
     @property
     def help(self):
-        # Get prefix from channel if available, otherwise use global
-        prefix = self.bot.get_channel_config(self.bot.channel if hasattr(self.bot, 'channel') else None, 'cmd_prefix', '!')
-        return f"Reload both configuration and code modules. Usage: {prefix}reload"
+        return self.format_help()
 
     def execute(self, nick, channel, args):
         """Execute reload command."""
         try:
+            # Nothing to do if no source or config file changed since the last reload
+            signature = self.bot.reloader.get_source_signature(self.bot.config_file)
+            if signature == getattr(self.bot, 'reload_signature', None):
+                self.bot.logger.info("No files changed since last reload, skipping")
+                return "Nothing to reload; no files changed."
+                
             # Preserve current state
             self.bot.logger.info("Preserving current state...")
             self.bot.reloader.preserve_state(self.bot)
@@ -38,6 +40,7 @@ class ReloadCommand(Command):
             if not self.bot.reloader.restore_state(self.bot, preserved_state):
                 return "Failed to restore bot state after reload. Check logs for details."
             
+            self.bot.reload_signature = signature
             return "Successfully reloaded configuration and code modules"
             
         except Exception as e:
@@ -3,15 +3,12 @@
 from . import Command
 
 class SayCommand(Command):
-    @property
-    def name(self):
-        return "say"
+    name = "say"
+    help_template = "Make the bot say something. Usage: {prefix}say <message>"
 
     @property
     def help(self):
-        # Get prefix from channel if available, otherwise use global
-        prefix = self.bot.get_channel_config(self.bot.channel if hasattr(self.bot, 'channel') else None, 'cmd_prefix', '!')
-        return f"Make the bot say something. Usage: {prefix}say <message>"
+        return self.format_help()
 
     def execute(self, nick, channel, args):
         """Execute the say command."""
@@ -4,6 +4,9 @@ from . import Command
 import time
 
 class SleepCommand(Command):
+    name = "sleep"
+    help_template = "Make the bot sleep for a specified time. Usage: {prefix}sleep <minutes>"
+
     def __init__(self, bot):
         """Initialize sleep command."""
         super().__init__(bot)
@@ -11,16 +14,10 @@ class SleepCommand(Command):
         self._help = "Put the bot to sleep for a specified number of minutes"
         self._usage = "sleep <minutes>"
         
-    @property
-    def name(self):
-        """Command name."""
-        return "sleep"
-        
     @property
     def help(self):
         """Command help text."""
-        prefix = self.get_prefix()
-        return f"Make the bot sleep for a specified time. Usage: {prefix}sleep <minutes>"
+        return self.format_help()
         
     @property
     def usage(self):
@@ -44,8 +41,7 @@ class SleepCommand(Command):
             if minutes > sleep_max:
                 return f"Sleep time cannot exceed {sleep_max} minutes"
 
-            channel_lower = channel.lower()
-            self.bot.sleep_until[channel_lower] = time.time() + (minutes * 60)
+            self.bot.sleep_until[channel.lower()] = time.time() + (minutes * 60)
             self.logger.info(f"Bot put to sleep in {channel} for {minutes} minutes by {nick}")
             prefix = self.get_prefix(channel)
             return f"Going to sleep for {minutes} minutes. Wake me with {prefix}wake"
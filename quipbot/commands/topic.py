@@ -3,15 +3,12 @@
 from . import Command
 
 class TopicCommand(Command):
-    @property
-    def name(self):
-        return "topic"
+    name = "topic"
+    help_template = "Change the channel topic. Usage: {prefix}topic <new topic>"
 
     @property
     def help(self):
-        # Get prefix from channel if available, otherwise use global
-        prefix = self.bot.get_channel_config(self.bot.channel if hasattr(self.bot, 'channel') else None, 'cmd_prefix', '!')
-        return f"Change the channel topic. Usage: {prefix}topic <new topic>"
+        return self.format_help()
 
     def execute(self, nick, channel, args):
         """Execute the topic command."""
@@ -3,11 +3,22 @@
 import pprint
 from .. import commands
 
+# Shared pretty printer for logging variable values
+_PP = pprint.PrettyPrinter(indent=2)
+
 class VarCommand(commands.Command):
-    @property
-    def name(self):
-        """Command name."""
-        return "var"
+    name = "var"
+
+    # Attribute path from the bot to each inspectable variable
+    _VAR_PATHS = {
+        'chat_history': ('ai_client', 'chat_history'),
+        'users': ('users',),
+        'channel_users': ('channel_users',),
+        'last_chat_times': ('last_chat_times',),
+        'last_bot_times': ('last_bot_times',),
+        'conversation_timers': ('conversation_timers',),
+        'sleep_until': ('sleep_until',),
+    }
 
     @property
     def help(self):
@@ -27,27 +38,18 @@ class VarCommand(commands.Command):
         original_name = args[0]  # Keep original name for messages
         var_name = original_name.lower()  # Lowercase for lookup
         
-        # Define available variables
-        variables = {
-            'chat_history': lambda: self.bot.ai_client.chat_history,
-            'users': lambda: self.bot.users,
-            'channel_users': lambda: self.bot.channel_users,
-            'last_chat_times': lambda: self.bot.last_chat_times,
-            'last_bot_times': lambda: self.bot.last_bot_times,
-            'conversation_timers': lambda: self.bot.conversation_timers,
-            'sleep_until': lambda: self.bot.sleep_until
-        }
-        
-        if var_name not in variables:
-            return f"Error: Variable '{original_name}' not found. Available variables: {', '.join(sorted(variables.keys()))}"
+        path = self._VAR_PATHS.get(var_name)
+        if path is None:
+            return f"Error: Variable '{original_name}' not found. Available variables: {', '.join(sorted(self._VAR_PATHS))}"
             
         try:
-            # Get the variable value using the lambda
-            value = variables[var_name]()
+            # Walk the attribute path from the bot
+            value = self.bot
+            for attr in path:
+                value = getattr(value, attr)
             
             # Pretty print the value to log
-            pp = pprint.PrettyPrinter(indent=2)
-            formatted_value = pp.pformat(value)
+            formatted_value = _PP.pformat(value)
             self.bot.logger.info(f"Variable {original_name} value:\n{formatted_value}")
             
             return f"Printed var {original_name} value to log"
@@ -3,6 +3,8 @@
 from . import Command
 
 class WakeCommand(Command):
+    name = "wake"
+
     def __init__(self, bot):
         """Initialize wake command."""
         super().__init__(bot)
@@ -10,11 +12,6 @@ class WakeCommand(Command):
         self._help = "Wake the bot from sleep mode"
         self._usage = "wake"
         
-    @property
-    def name(self):
-        """Command name."""
-        return "wake"
-        
     @property
     def help(self):
         """Command help text."""
@@ -27,9 +24,7 @@ class WakeCommand(Command):
         
     def execute(self, nick, channel, args):
         """Execute the wake command."""
-        channel_lower = channel.lower()
-        if channel_lower in self.bot.sleep_until:
-            del self.bot.sleep_until[channel_lower]
+        if self.bot.sleep_until.pop(channel.lower(), None) is not None:
             self.bot.logger.info(f"Bot woken up in {channel} by {nick}")
             return "I'm awake! Ready to chat again."
         else:
@@ -1,23 +1,47 @@
 """Message handler for QuipBot."""
 
 import logging
-import re
-from pathlib import Path
-import pkgutil
-import importlib
+import sys
 from .. import commands
 import time
 import threading
+from functools import lru_cache
 from ..commands import load_commands
 
 logger = logging.getLogger('QuipBot')
 
+# Channel type prefixes (RFC 2811 CHANTYPES), nicks can't start with these
+CHANNEL_PREFIXES = ('#', '&', '+', '!')
+
+# Channel status prefixes that may precede a nick in a NAMES reply
+NICK_PREFIXES = '@+%~&!'
+
+# Channel modes that change a user's status, mapped to the channel_users flag
+STATUS_MODES = {'o': 'op', 'v': 'voice'}
+
+# Reply to a server PING, the PING token is appended as-is
+PONG_PREFIX = 'PONG '
+
+@lru_cache(maxsize=4096)
+def _split_prefix(prefix):
+    """Split an IRC prefix into nick and userhost.
+    
+    The same few users send most lines in a channel, so results are
+    memoized per prefix.
+    """
+    nick, sep, userhost = prefix.partition("!")
+    if not sep or "@" not in userhost:
+        return prefix, ""
+    return nick, userhost
+
 class MessageHandler:
     def __init__(self, bot):
         """Initialize message handler."""
         self.bot = bot
         self.logger = self.bot.logger
         self.commands = {}
+        self._sorted_names = ()
+        self._sorted_names_source = None
         self._event_bindings = {}
         
         # Bind event handlers
@@ -30,6 +54,12 @@ class MessageHandler:
         self.bind_event('INVITE', self.handle_invite)
         self.bind_event('KICK', self.handle_kick)
         
+        # Numeric replies with a dedicated handle_<numeric> method
+        self._numeric_handlers = {
+            name[7:]: getattr(self, name) for name in dir(type(self))
+            if name.startswith('handle_') and name[7:].isdigit()
+        }
+        
         # Initialize but don't start channel check thread yet
         self.channel_check_thread = None
         
@@ -58,12 +88,12 @@ class MessageHandler:
                         logger.warning(f"Handler: Command name mismatch: {cmd_name} != {command.name}")
                         continue
                     self.commands[cmd_name] = command
-                    logger.debug(f"Handler: Successfully initialized command: {cmd_name}")
+                    logger.debug("Handler: Successfully initialized command: %s", cmd_name)
                 except Exception as e:
                     logger.error(f"Handler: Error initializing command {command_class.__name__}: {e}", exc_info=True)
             
             if self.commands:
-                logger.info(f"Handler: Successfully loaded {len(self.commands)} commands: {', '.join(sorted(self.commands.keys()))}")
+                logger.info("Handler: Successfully loaded %s commands: %s", len(self.commands), ', '.join(self.command_names))
             else:
                 logger.error("Handler: No commands were initialized!")
             
@@ -71,6 +101,18 @@ class MessageHandler:
             logger.error(f"Handler: Error loading commands: {e}", exc_info=True)
             raise  # Re-raise to ensure reload failure is detected
 
+    @property
+    def command_names(self):
+        """Sorted tuple of loaded command names.
+
+        Rebuilt only when the commands dict is replaced, which happens on
+        every (re)load and when the reloader restores the old commands.
+        """
+        if self._sorted_names_source is not self.commands:
+            self._sorted_names = tuple(sorted(self.commands))
+            self._sorted_names_source = self.commands
+        return self._sorted_names
+
     def bind_event(self, event, callback):
         """Bind a callback to an IRC event.
         
@@ -78,47 +120,61 @@ class MessageHandler:
             event: The IRC event (e.g., 'PRIVMSG', 'JOIN')
             callback: The function to call when the event occurs
         """
-        if event not in self._event_bindings:
-            self._event_bindings[event] = set()
-        self._event_bindings[event].add(callback)
+        self._event_bindings.setdefault(event, set()).add(callback)
 
     def handle_line(self, line):
         """Handle a line from the IRC server."""
-        self.logger.raw(f"<<< {line}")
-
-        if line.startswith('PING'):
-            self.bot.send_raw(f"PONG {line[5:]}")
-            return
+        self.logger.raw("<<< %s", line)
 
-        if ' ' not in line:
+        # Lines without a space carry no command, this also rules out empty lines
+        sp1 = line.find(' ')
+        if sp1 == -1:
             return
 
         # Parse IRC message
+        # Slice around the first two spaces instead of splitting into lists
         if line[0] == ':':
-            prefix, command, *params = line[1:].split(' ', 2)
-            nick, userhost = self._parse_prefix(prefix)
+            prefix = line[1:sp1]
+            sp2 = line.find(' ', sp1 + 1)
+            if sp2 == -1:
+                command = line[sp1 + 1:]
+                params = ''
+            else:
+                command = line[sp1 + 1:sp2]
+                params = line[sp2 + 1:]
+            # Call the cached parser directly, this runs for most lines
+            nick, userhost = _split_prefix(prefix)
             
             # Store/update user info when we see them
             if nick and userhost and nick != self.bot.nick:
-                if nick not in self.bot.users:
-                    self.bot.users[nick] = {'host': userhost, 'account': None}
-                elif not self.bot.users[nick].get('host'):
-                    self.bot.users[nick]['host'] = userhost
+                users = self.bot.users
+                user_info = users.get(nick)
+                if user_info is None:
+                    # Nicks stay as dict keys for as long as the user is seen
+                    users[sys.intern(nick)] = {'host': userhost, 'account': None}
+                elif not user_info.get('host'):
+                    user_info['host'] = userhost
         else:
+            command = line[:sp1]
+            params = line[sp1 + 1:]
+            # Server PINGs are the only unprefixed command that needs a reply
+            if command == 'PING':
+                self.bot.send_raw(PONG_PREFIX + params)
+                return
             prefix = ''
             nick = ''
             userhost = ''
-            command, *params = line.split(' ', 1)
 
-        params = ' '.join(params).lstrip(':')
+        # A leading ':' marks a lone trailing parameter, only that one is removed
+        if params[:1] == ':':
+            params = params[1:]
+        # Commands come from a small fixed set used as dict keys for dispatch
+        command = sys.intern(command)
 
-        # Handle numeric responses
-        if command.isdigit():
-            # Get the full params including the target
-            if params.startswith(':'):
-                params = params[1:]
-            
-            numeric_handler = getattr(self, f'handle_{command}', None)
+        # Handle numeric responses, only the first character needs checking
+        # since every other command is alphabetic
+        if command[:1].isdigit():
+            numeric_handler = self._numeric_handlers.get(command)
             if numeric_handler:
                 # self.logger.debug(f"Handling numeric {command} with handler: {params}")
                 try:
@@ -126,16 +182,6 @@ class MessageHandler:
                 except Exception as e:
                     self.logger.error(f"Error in numeric handler {command}: {e}")
             else:
-                # Try standard numeric handlers for specific numerics we care about
-                if command in ('353', '366', '352', '354', '315'):
-                    handler_name = f'handle_{command}'
-                    if hasattr(self, handler_name):
-                        try:
-                            self.logger.debug(f"Found handler for {command}, calling {handler_name}")
-                            getattr(self, handler_name)(nick, userhost, params)
-                            return
-                        except Exception as e:
-                            self.logger.error(f"Error in numeric handler {handler_name}: {e}")
                 # Fall back to generic numeric handler
                 self.bot.handle_numeric(command, params)
             return
@@ -149,8 +195,9 @@ class MessageHandler:
             return
 
         # Trigger any registered event callbacks
-        if command in self._event_bindings:
-            for callback in self._event_bindings[command]:
+        callbacks = self._event_bindings.get(command)
+        if callbacks:
+            for callback in callbacks:
                 try:
                     callback(nick, userhost, params)
                 except Exception as e:
@@ -158,17 +205,19 @@ class MessageHandler:
 
     def handle_privmsg(self, nick, userhost, params):
         """Handle PRIVMSG command."""
-        if ' :' not in params:
+        sep = params.find(' :')
+        if sep == -1:
             return
 
-        target, message = params.split(' :', 1)
+        target = params[:sep]
+        message = params[sep + 2:]
         
         # Handle CTCP requests
         if message.startswith('\x01'):
             return self.handle_ctcp(nick, userhost, message)
         
         # Handle channel messages
-        if target.startswith('#'):
+        if target.startswith(CHANNEL_PREFIXES):
             # Skip if we're not in the channel
             if not self.bot.is_in_channel(target):
                 return
@@ -182,129 +231,129 @@ class MessageHandler:
 
     def handle_join(self, nick, userhost, params):
         """Handle JOIN command."""
-        channel = params.lstrip(':')
-        if nick.lower() == self.bot.current_nick.lower():
-            self.logger.debug(f"Bot joining {channel}")
-            # Clear and rebuild channel users list
-            self.bot.channel_users[channel] = {}
-            # Add ourselves to the channel user list with current nickname
-            self.bot.channel_users[channel][self.bot.current_nick] = {
-                'op': False,
-                'voice': False
+        # Channel names and nicks are kept as dict keys for the whole stay
+        channel = sys.intern(params.lstrip(':'))
+        bot = self.bot
+        channel_users = bot.channel_users
+        current_nick = bot.current_nick
+        if nick.lower() == bot.get_current_nick_lower():
+            self.logger.debug("Bot joining %s", channel)
+            # Clear and rebuild channel users list, adding ourselves with current nickname
+            self._forget_channel(channel)
+            channel_users[channel] = {
+                current_nick: {
+                    'op': False,
+                    'voice': False
+                }
             }
-            self.logger.info(f"Joined channel: {channel} (as {self.bot.current_nick})")
+            bot.user_channels.setdefault(current_nick, set()).add(channel)
+            self.logger.info("Joined channel: %s (as %s)", channel, current_nick)
             
             # Initialize timers for this channel
-            self.bot.last_chat_times[channel.lower()] = time.time()
-            self.bot.last_action_times[channel.lower()] = time.time()
+            channel_lower = channel.lower()
+            now = time.time()
+            bot.last_chat_times[channel_lower] = now
+            bot.last_action_times[channel_lower] = now
             
             # Server will automatically send NAMES list after JOIN
             # handle_366 (end of NAMES) will trigger the WHO request
             
             # Generate and send entrance message if enabled
-            if self.bot.get_channel_config(channel, 'ai_entrance', False):
-                self.logger.debug(f"Generating entrance message for {channel}")
-                entrance_prompt = self.bot.get_channel_config(channel, 'ai_prompt_entrance', 'Generate a channel entrance message')
-                entrance_msg = self.bot.ai_client.get_response(
+            if bot.get_channel_config(channel, 'ai_entrance', False):
+                self.logger.debug("Generating entrance message for %s", channel)
+                entrance_prompt = bot.get_channel_config(channel, 'ai_prompt_entrance', 'Generate a channel entrance message')
+                entrance_msg = bot.ai_client.get_response(
                     entrance_prompt,
-                    self.bot.current_nick,
+                    bot.current_nick,
                     channel=channel,
                     add_to_history=True  # Add entrance message to history
                 )
                 if entrance_msg:
                     # Format the entrance message to remove encapsulating quotes
-                    formatted_entrance = self.bot.format_message(entrance_msg)
-                    self.bot.send_channel_message(channel, formatted_entrance, add_to_history=True)  # Add to history
-                    self.logger.info(f"Sent entrance message to {channel}: {formatted_entrance}")
+                    formatted_entrance = bot.format_message(entrance_msg)
+                    bot.send_channel_message(channel, formatted_entrance, add_to_history=True)  # Add to history
+                    self.logger.info("Sent entrance message to %s: %s", channel, formatted_entrance)
                 else:
-                    self.logger.debug(f"Failed to generate entrance message for {channel}")
+                    self.logger.debug("Failed to generate entrance message for %s", channel)
         else:
-            self.logger.info(f"User {nick} joined {channel}")
-            if channel in self.bot.channel_users:
-                self.bot.channel_users[channel][nick] = {
+            self.logger.info("User %s joined %s", nick, channel)
+            users_in_channel = channel_users.get(channel)
+            if users_in_channel is not None:
+                nick = sys.intern(nick)
+                users_in_channel[nick] = {
                     'op': False,
                     'voice': False
                 }
-                # Request WHOX info just for this user
+                bot.user_channels.setdefault(nick, set()).add(channel)
+                # bot.users already has the host from handle_line, request WHOX
+                # info just for this user to fill in the rest
                 # %tnuhiraf gives us: channel, nick, user, host, ip, realname, account, flags
-                self.bot.send_raw(f"WHO {nick} %tnuhiraf")
-                self.logger.debug(f"Added {nick} to {channel} users")
-        
-        # Track user info from JOIN
-        if userhost and "!" in userhost and "@" in userhost:
-            ident, host = userhost.split("@", 1)
-            if nick not in self.bot.users:
-                self.bot.users[nick] = {
-                    'ident': ident,
-                    'host': host,
-                    'ip': None,
-                    'account': None,
-                    'realname': None,  # Will be updated by WHO/WHOX response
-                    'away': False,     # Assume not away until WHO/WHOX updates
-                    'oper': False      # Assume not oper until WHO/WHOX updates
-                }
-            elif not self.bot.users[nick].get('host'):
-                self.bot.users[nick].update({
-                    'ident': ident,
-                    'host': host
-                })
+                bot.send_raw(f"WHO {nick} %tnuhiraf")
+                self.logger.debug("Added %s to %s users", nick, channel)
 
     def handle_part(self, nick, userhost, params):
         """Handle PART command."""
-        channel = params.split()[0]
-        if nick.lower() == self.bot.current_nick.lower():
-            if channel in self.bot.channel_users:
-                del self.bot.channel_users[channel]
-                self.logger.info(f"Left channel: {channel}")
+        channel = params.partition(' ')[0]
+        if nick.lower() == self.bot.get_current_nick_lower():
+            if self._forget_channel(channel):
+                self.logger.info("Left channel: %s", channel)
         else:
-            if channel in self.bot.channel_users and nick in self.bot.channel_users[channel]:
-                del self.bot.channel_users[channel][nick]
-                self.logger.info(f"User {nick} left {channel}")
+            users = self.bot.channel_users.get(channel)
+            if users is not None and users.pop(nick, None) is not None:
+                self._remove_member(nick, channel)
+                self.logger.info("User %s left %s", nick, channel)
 
     def handle_quit(self, nick, userhost, params):
         """Handle QUIT command."""
         # Remove user from all channels they were in
-        for channel, users in self.bot.channel_users.items():
-            if nick in users:
-                del users[nick]
-                self.logger.debug(f"Removed quit user {nick} from {channel}")
+        channel_users = self.bot.channel_users
+        for channel in self.bot.user_channels.pop(nick, ()):
+            users = channel_users.get(channel)
+            if users is not None and users.pop(nick, None) is not None:
+                self.logger.debug("Removed quit user %s from %s", nick, channel)
         
         # Remove from global users list
-        if nick in self.bot.users:
-            del self.bot.users[nick]
-            self.logger.info(f"User {nick} quit")
+        if self.bot.users.pop(nick, None) is not None:
+            self.logger.info("User %s quit", nick)
 
     def handle_nick(self, nick, userhost, params):
         """Handle NICK command."""
         new_nick = params.lstrip(':')
         
         # Update user in all channels they're in
-        for channel, users in self.bot.channel_users.items():
-            if nick in users:
-                # Preserve user data when changing nick
-                users[new_nick] = users.pop(nick)
-                self.logger.debug(f"Updated nick {nick} to {new_nick} in {channel}")
+        channels = self.bot.user_channels.pop(nick, None)
+        if channels is not None:
+            self.bot.user_channels.setdefault(new_nick, set()).update(channels)
+            channel_users = self.bot.channel_users
+            for channel in channels:
+                users = channel_users.get(channel)
+                user_data = users.pop(nick, None) if users is not None else None
+                if user_data is not None:
+                    # Preserve user data when changing nick
+                    users[new_nick] = user_data
+                    self.logger.debug("Updated nick %s to %s in %s", nick, new_nick, channel)
         
         # Update global users list
-        if nick in self.bot.users:
+        user_data = self.bot.users.pop(nick, None)
+        if user_data is not None:
             # Preserve all user data including new fields
-            self.bot.users[new_nick] = self.bot.users.pop(nick)
-            self.logger.debug(f"User {nick} changed nick to {new_nick} - Data: {self.bot.users[new_nick]}")
+            self.bot.users[new_nick] = user_data
+            self.logger.debug("User %s changed nick to %s - Data: %s", nick, new_nick, user_data)
 
-        self.logger.info(f"User {nick} changed nick to {new_nick}")
+        self.logger.info("User %s changed nick to %s", nick, new_nick)
 
     def handle_mode(self, nick, userhost, params):
         """Handle MODE command."""
-        parts = params.split()
-        if len(parts) < 2:
-            return
-            
-        channel = parts[0]
-        if channel not in self.bot.channel_users:
+        channel, _, rest = params.partition(' ')
+        channel_users = self.bot.channel_users.get(channel)
+        if channel_users is None:
             return
 
-        modes = parts[1]
-        mode_params = parts[2:]
+        # Only split out the mode parameters once we know the channel is tracked
+        modes, _, rest = rest.partition(' ')
+        if not modes:
+            return
+        mode_params = rest.split()
         adding = True
         param_index = 0
 
@@ -313,16 +362,14 @@ class MessageHandler:
                 adding = True
             elif mode == '-':
                 adding = False
-            elif mode in 'ov':  # op and voice modes
-                if param_index < len(mode_params):
+            else:
+                flag = STATUS_MODES.get(mode)  # op and voice modes
+                if flag is not None and param_index < len(mode_params):
                     target = mode_params[param_index]
-                    if target in self.bot.channel_users[channel]:
-                        if mode == 'o':
-                            self.bot.channel_users[channel][target]['op'] = adding
-                            self.logger.info(f"User {target} {'given' if adding else 'removed from'} op in {channel}")
-                        elif mode == 'v':
-                            self.bot.channel_users[channel][target]['voice'] = adding
-                            self.logger.info(f"User {target} {'given' if adding else 'removed from'} voice in {channel}")
+                    target_info = channel_users.get(target)
+                    if target_info is not None:
+                        target_info[flag] = adding
+                        self.logger.info("User %s %s %s in %s", target, 'given' if adding else 'removed from', flag, channel)
                     param_index += 1
 
     def handle_353(self, nick, userhost, params):
@@ -331,25 +378,37 @@ class MessageHandler:
         if len(parts) > 1:
             channel = parts[0].split()[-1]
             nicks = parts[1].split()
-            self.logger.debug(f"Processing NAMES response for {channel} with {len(nicks)} users: {', '.join(nicks)}")
-            
-            if channel not in self.bot.channel_users:
-                self.bot.channel_users[channel] = {}
-                self.logger.debug(f"Initializing user list for {channel}")
-            
+            # Skip building the per-nick debug output unless it will be logged
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                self.logger.debug("Processing NAMES response for %s with %s users: %s", channel, len(nicks), ', '.join(nicks))
+            
+            channel_users = self.bot.channel_users.get(channel)
+            if channel_users is None:
+                channel_users = self.bot.channel_users[channel] = {}
+                self.logger.debug("Initializing user list for %s", channel)
+            
+            # Collect the entries first and add them to the channel in one update
+            batch = {}
+            user_channels = self.bot.user_channels
             for n in nicks:
-                prefix = ''
-                while n and n[0] in '@+%~&!':
-                    prefix += n[0]
-                    n = n[1:]
+                # Split off the status prefixes in one pass
+                stripped = n.lstrip(NICK_PREFIXES)
+                prefix = n[:len(n) - len(stripped)]
+                n = stripped
                 if n:  # Only add if we have a nickname after stripping prefixes
-                    self.bot.channel_users[channel][n] = {
+                    n = sys.intern(n)
+                    batch[n] = {
                         'op': '@' in prefix,
                         'voice': '+' in prefix
                     }
-                    self.logger.debug(f"NAMES: Added user {n} to {channel} with prefix '{prefix}', data: {self.bot.channel_users[channel][n]}")
+                    user_channels.setdefault(n, set()).add(channel)
+                    if debug:
+                        self.logger.debug("NAMES: Added user %s to %s with prefix '%s', data: %s", n, channel, prefix, batch[n])
+            channel_users.update(batch)
             
-            self.logger.debug(f"NAMES complete - Users in {channel}: {', '.join(sorted(self.bot.channel_users[channel].keys()))}")
+            if debug:
+                self.logger.debug("NAMES complete - Users in %s: %s", channel, ', '.join(sorted(channel_users.keys())))
 
     def handle_366(self, nick, userhost, params):
         """Handle end of NAMES list."""
@@ -357,15 +416,16 @@ class MessageHandler:
         # Example: "Quip2 #qtest :End of /NAMES list."
         try:
             # Split on space, channel is the second parameter
-            parts = params.split()
+            parts = params.split(' ', 2)
             if len(parts) >= 2:
                 channel = parts[1]  # Channel is the second parameter
-                self.logger.debug(f"End of NAMES for {channel}")
-                self.logger.debug(f"Sending WHO request to get full user info")
+                self.logger.debug("End of NAMES for %s", channel)
+                self.logger.debug("Sending WHO request to get full user info")
                 # Send WHO request with WHOX format to get complete user info
                 # %tnuhiraf gives us: channel, nick, user, host, ip, realname, account, flags
                 self.bot.send_raw(f"WHO {channel} %tnuhiraf")
-                self.logger.debug(f"Current users before WHO: {', '.join(sorted(self.bot.channel_users.get(channel, {}).keys()))}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Current users before WHO: %s", ', '.join(sorted(self.bot.channel_users.get(channel, {}).keys())))
         except Exception as e:
             self.logger.error(f"Error processing end of NAMES: {e}")
             return
@@ -373,7 +433,8 @@ class MessageHandler:
     def handle_352(self, nick, userhost, params):
         """Handle WHO response (numeric 352)."""
         # WHO response format: <channel> <user> <host> <server> <nick> <H|G>[*][@|+] :<hopcount> <real_name>
-        parts = params.split()
+        # Keep the realname in one piece instead of splitting it into words
+        parts = params.split(' ', 7)
         if len(parts) >= 8:
             channel = parts[0]
             ident = parts[1]
@@ -382,28 +443,32 @@ class MessageHandler:
             status = parts[5]
             
             # Get realname (everything after the :)
-            realname = ' '.join(parts[7:]).lstrip(':')
+            realname = parts[7].lstrip(':')
             
             # Parse status flags
             away = 'G' in status  # G = Gone/Away, H = Here
             oper = '*' in status  # * indicates server operator
             
-            if channel in self.bot.channel_users:
+            channel_users = self.bot.channel_users.get(channel)
+            if channel_users is not None:
                 # Update or create user entry
-                if nick not in self.bot.channel_users[channel]:
-                    self.logger.debug(f"WHO: Creating new entry for {nick} in {channel}")
-                    self.bot.channel_users[channel][nick] = {}
+                user_info = channel_users.get(nick)
+                if user_info is None:
+                    self.logger.debug("WHO: Creating new entry for %s in %s", nick, channel)
+                    user_info = channel_users[nick] = {}
+                    self.bot.user_channels.setdefault(nick, set()).add(channel)
                 
-                # Update user info
-                old_data = self.bot.channel_users[channel][nick].copy() if nick in self.bot.channel_users[channel] else {}
-                self.bot.channel_users[channel][nick].update({
-                    'op': '@' in status,
-                    'voice': '+' in status
-                })
+                # Update user info, only keeping the old data if it will be logged
+                debug = self.logger.isEnabledFor(logging.DEBUG)
+                old_data = user_info.copy() if debug else None
+                user_info['op'] = '@' in status
+                user_info['voice'] = '+' in status
                 
                 # Update global user info
-                if nick not in self.bot.users:
-                    self.bot.users[nick] = {
+                bot_users = self.bot.users
+                global_info = bot_users.get(nick)
+                if global_info is None:
+                    global_info = bot_users[nick] = {
                         'ident': ident,
                         'host': host,
                         'ip': None,  # Standard WHO doesn't provide IP
@@ -413,7 +478,7 @@ class MessageHandler:
                         'oper': oper
                     }
                 else:
-                    self.bot.users[nick].update({
+                    global_info.update({
                         'ident': ident,
                         'host': host,
                         'realname': realname,
@@ -421,14 +486,16 @@ class MessageHandler:
                         'oper': oper
                     })
                 
-                self.logger.debug(f"WHO: Updated {nick} in {channel} - Old data: {old_data}, New data: {self.bot.channel_users[channel][nick]}")
-                self.logger.debug(f"WHO: Global user data for {nick}: {self.bot.users[nick]}")
+                if debug:
+                    self.logger.debug("WHO: Updated %s in %s - Old data: %s, New data: %s", nick, channel, old_data, user_info)
+                    self.logger.debug("WHO: Global user data for %s: %s", nick, global_info)
 
     def handle_354(self, nick, userhost, params):
         """Handle WHOX response (numeric 354) for account information."""
         # WHOX response format from Undernet:
         # <target/botnick> <dummy> <user> <host> <ip> <nick> <status+flags> <account> :<realname>
-        parts = params.split()
+        # Keep the realname in one piece instead of splitting it into words
+        parts = params.split(' ', 8)
         if len(parts) >= 8:
             # Note: parts[0] is our bot's nick, not the channel
             user_nick = parts[5]  # Nick is in position 5
@@ -439,106 +506,105 @@ class MessageHandler:
             flags = parts[6]      # Status+flags in position 6
             
             # Get realname (everything after the account field)
-            realname = ' '.join(parts[8:]).lstrip(':') if len(parts) > 8 else ''
+            realname = parts[8].lstrip(':') if len(parts) > 8 else ''
             
             # Parse status flags
             away = 'G' in flags   # G = Gone/Away, H = Here
             oper = '*' in flags   # * indicates server operator
             
-            self.logger.debug(f"WHOX parsed data - Nick: {user_nick}, Ident: {ident}, Host: {host}, IP: {ip}, Account: {account}, Flags: {flags}, Realname: {realname}")
+            self.logger.debug("WHOX parsed data - Nick: %s, Ident: %s, Host: %s, IP: %s, Account: %s, Flags: %s, Realname: %s", user_nick, ident, host, ip, account, flags, realname)
             
             # Convert '0' to None for no account
             account = None if account == '0' else account
             
-            # Update global user info first
-            if user_nick not in self.bot.users:
-                self.bot.users[user_nick] = {
-                    'ident': ident,
-                    'host': host,
-                    'ip': ip,
-                    'account': account,
-                    'realname': realname,
-                    'away': away,
-                    'oper': oper
-                }
+            # Update global user info first, the reply carries every field
+            whox_info = {
+                'ident': ident,
+                'host': host,
+                'ip': ip,
+                'account': account,
+                'realname': realname,
+                'away': away,
+                'oper': oper
+            }
+            bot_users = self.bot.users
+            global_info = bot_users.get(user_nick)
+            if global_info is None:
+                global_info = bot_users[user_nick] = whox_info
             else:
-                self.bot.users[user_nick].update({
-                    'ident': ident,
-                    'host': host,
-                    'ip': ip,
-                    'account': account,
-                    'realname': realname,
-                    'away': away,
-                    'oper': oper
-                })
+                global_info.update(whox_info)
             
             # Update user in all channels they're in
-            for channel, users in self.bot.channel_users.items():
-                if user_nick in users:
-                    old_data = users[user_nick].copy()
-                    users[user_nick].update({
-                        'op': '@' in flags or '*' in flags,
-                        'voice': '+' in flags
-                    })
-                    self.logger.debug(f"WHOX: New channel data for {user_nick} in {channel}: {users[user_nick]}")
-            
-            self.logger.debug(f"WHOX: Global user data for {user_nick}: {self.bot.users[user_nick]}")
+            is_op = '@' in flags or '*' in flags
+            is_voice = '+' in flags
+            channel_users = self.bot.channel_users
+            for channel in self.bot.user_channels.get(user_nick, ()):
+                users = channel_users.get(channel)
+                user_info = users.get(user_nick) if users is not None else None
+                if user_info is not None:
+                    user_info['op'] = is_op
+                    user_info['voice'] = is_voice
+                    self.logger.debug("WHOX: New channel data for %s in %s: %s", user_nick, channel, user_info)
+            
+            self.logger.debug("WHOX: Global user data for %s: %s", user_nick, global_info)
         else:
-            self.logger.debug(f"WHOX: Insufficient parts in response ({len(parts)} < 8)")
+            self.logger.debug("WHOX: Insufficient parts in response (%s < 8)", len(parts))
 
     def handle_315(self, nick, userhost, params):
         """Handle end of WHO list."""
         # Format: <nick> <channel> :End of /WHO list
-        parts = params.split()
-        if len(parts) >= 1:
-            channel = parts[0]
-            if channel in self.bot.channel_users:
-                self.logger.debug(f"WHO list complete for {channel} - Final user list: {', '.join(sorted(self.bot.channel_users[channel].keys()))}")
-                self.logger.debug(f"Full channel_users data for {channel}: {self.bot.channel_users[channel]}")
+        # Nothing to do here unless debug logging is on
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        channel = params.partition(' ')[0]
+        users = self.bot.channel_users.get(channel)
+        if users is not None:
+            self.logger.debug("WHO list complete for %s - Final user list: %s", channel, ', '.join(sorted(users.keys())))
+            self.logger.debug("Full channel_users data for %s: %s", channel, users)
 
     def handle_invite(self, nick, userhost, params):
         """Handle INVITE command."""
-        parts = params.split()
-        if len(parts) < 2:
+        target_nick, _, rest = params.partition(' ')
+        invited_channel = rest.partition(' ')[0].lstrip(':')
+        if not target_nick or not invited_channel:
             return
-            
-        target_nick = parts[0]
-        invited_channel = parts[1].lstrip(':')
         
         # Only accept invites meant for us
-        if target_nick.lower() != self.bot.current_nick.lower():
+        if target_nick.lower() != self.bot.get_current_nick_lower():
             return
             
         # Check if this is a configured channel
-        configured_channels = {c['name'].lower(): c.get('key', '') for c in self.bot.channels}
         invited_channel_lower = invited_channel.lower()
+        channel_config = self.bot.channels_by_name.get(invited_channel_lower)
         
-        if invited_channel_lower in configured_channels:
+        if channel_config is not None:
             if invited_channel_lower not in self.bot.channel_users:
-                self.logger.info(f"Accepting invite to configured channel {invited_channel} from {nick}")
-                key = configured_channels[invited_channel_lower]
+                self.logger.info("Accepting invite to configured channel %s from %s", invited_channel, nick)
+                key = channel_config.get('key', '')
                 self.bot.send_raw(f"JOIN {invited_channel} {key}")
             else:
-                self.logger.debug(f"Ignoring invite to {invited_channel} - already in channel")
+                self.logger.debug("Ignoring invite to %s - already in channel", invited_channel)
         else:
-            self.logger.debug(f"Ignoring invite to {invited_channel} - not a configured channel")
+            self.logger.debug("Ignoring invite to %s - not a configured channel", invited_channel)
 
     def handle_kick(self, nick, userhost, params):
         """Handle KICK command."""
-        parts = params.split()
+        # Leave the kick reason unsplit
+        parts = params.split(' ', 2)
         if len(parts) >= 2:
             channel = parts[0]
             kicked_nick = parts[1]
             
-            if channel in self.bot.channel_users:
-                if kicked_nick in self.bot.channel_users[channel]:
-                    del self.bot.channel_users[channel][kicked_nick]
-                    self.logger.debug(f"Removed kicked user {kicked_nick} from {channel}")
+            users = self.bot.channel_users.get(channel)
+            if users is not None:
+                if users.pop(kicked_nick, None) is not None:
+                    self._remove_member(kicked_nick, channel)
+                    self.logger.debug("Removed kicked user %s from %s", kicked_nick, channel)
                     
                 # If we were kicked, clear the channel's user list
-                if kicked_nick.lower() == self.bot.current_nick.lower():
-                    del self.bot.channel_users[channel]
-                    self.logger.info(f"Bot was kicked from {channel}")
+                if kicked_nick.lower() == self.bot.get_current_nick_lower():
+                    self._forget_channel(channel)
+                    self.logger.info("Bot was kicked from %s", channel)
 
     def _handle_command(self, command_name, nick, channel, args):
         """Handle a bot command.
@@ -562,15 +628,6 @@ class MessageHandler:
                 self.logger.warning(f"Command '{command_name}' is disabled in {channel}")
                 return
             
-            # Get user info including host and account
-            user_info = self.bot.users.get(nick, {})
-            ident = user_info.get('ident', '')
-            host = user_info.get('host', '')
-            userhost = f"{ident}@{host}" if ident and host else None
-            
-            # Get channel-specific user info
-            channel_info = self.bot.channel_users.get(channel, {}).get(nick, {})
-            
             # Check permissions
             if not self._check_command_permissions(nick, channel, cmd_config):
                 required = cmd_config.get('requires', 'any')
@@ -599,11 +656,38 @@ class MessageHandler:
         Returns:
             bool: True if user has permission, False otherwise
         """
+        if not self.bot.users.get(nick):
+            self.logger.debug("No user info found for %s", nick)
+            return False
+            
+        # Try the cheap channel flags first, matching the admin masks is
+        # only needed when they don't already permit the command
+        if cmd_config.get('enabled', True):
+            required = cmd_config.get('requires', 'any').lower()
+            if required == 'any':
+                return True
+            if required == 'op' or required == 'voice':
+                channel_info = self.bot.channel_users.get(channel, {}).get(nick, {})
+                if channel_info.get('op', False) or (required == 'voice' and channel_info.get('voice', False)):
+                    return True
+                    
+        return self._permits(self._get_user_permissions(nick, channel), channel, cmd_config)
+
+    def _get_user_permissions(self, nick, channel):
+        """Get the permission flags of a user in a channel.
+        
+        Args:
+            nick: The nickname to check
+            channel: The channel to check
+            
+        Returns:
+            tuple: (is_admin, is_op, is_voice), or None if the user is unknown
+        """
         # Get user info including host and account
         user_info = self.bot.users.get(nick, {})
         if not user_info:
-            self.logger.debug(f"No user info found for {nick}")
-            return False
+            self.logger.debug("No user info found for %s", nick)
+            return None
             
         # Get channel-specific user info
         channel_info = self.bot.channel_users.get(channel, {}).get(nick, {})
@@ -614,8 +698,28 @@ class MessageHandler:
         userhost = f"{ident}@{host}" if ident and host else None
         
         # Check if user is admin (admins can use any command)
-        if userhost and self.bot.permissions.is_admin(nick, userhost):
-            self.logger.debug(f"User {nick} ({userhost}) is admin - command permitted")
+        is_admin = bool(userhost and self.bot.permissions.is_admin(nick, userhost))
+        if is_admin:
+            self.logger.debug("User %s (%s) is admin - command permitted", nick, userhost)
+            
+        return (is_admin, channel_info.get('op', False), channel_info.get('voice', False))
+
+    def _permits(self, permissions, channel, cmd_config):
+        """Check if a set of permission flags allows using a command.
+        
+        Args:
+            permissions: Flags from _get_user_permissions()
+            channel: The channel where the command was used
+            cmd_config: The command configuration dict
+            
+        Returns:
+            bool: True if the flags permit the command, False otherwise
+        """
+        if permissions is None:
+            return False
+            
+        is_admin, is_op, is_voice = permissions
+        if is_admin:
             return True
             
         # Get required permission level
@@ -626,27 +730,51 @@ class MessageHandler:
             return False
             
         elif required == 'op':
-            if not channel_info.get('op', False):
+            if not is_op:
                 return False
                 
         elif required == 'voice':
-            if not (channel_info.get('voice', False) or channel_info.get('op', False)):
+            if not (is_voice or is_op):
                 return False
                 
         # Check if command is enabled for the channel
         if not cmd_config.get('enabled', True):
-            self.logger.debug(f"Command is disabled in {channel}")
+            self.logger.debug("Command is disabled in %s", channel)
             return False
             
         # 'any' permission level always returns True
         return True
 
+    def _remove_member(self, nick, channel):
+        """Remove a channel from a user's entry in the user_channels index."""
+        user_channels = self.bot.user_channels
+        channels = user_channels.get(nick)
+        if channels is not None:
+            channels.discard(channel)
+            if not channels:
+                del user_channels[nick]
+
+    def _forget_channel(self, channel):
+        """Drop a channel's user list and its users' user_channels entries.
+        
+        Args:
+            channel: The channel as keyed in channel_users
+            
+        Returns:
+            bool: True if the channel was being tracked
+        """
+        users = self.bot.channel_users.pop(channel, None)
+        if users is None:
+            return False
+        for nick in users:
+            self._remove_member(nick, channel)
+        return True
+
     def _parse_prefix(self, prefix):
         """Parse IRC prefix into nick and userhost."""
-        if "!" in prefix and "@" in prefix:
-            nick, userhost = prefix.split("!", 1)
-            return nick, userhost
-        return prefix, ""
+        if not prefix:
+            return prefix, ""
+        return _split_prefix(prefix)
 
     def _check_channels_loop(self):
         """Periodically check if we're in all configured channels."""
@@ -654,15 +782,15 @@ class MessageHandler:
             try:
                 # Only check if we're connected
                 if self.bot.connected:
-                    configured_channels = {c['name'].lower(): c.get('key', '') for c in self.bot.channels}
+                    configured_channels = self.bot.channels_by_name
                     current_channels = {chan.lower() for chan in self.bot.channel_users.keys()}
                     
                     # Find channels we should be in but aren't
-                    missing_channels = set(configured_channels.keys()) - current_channels
+                    missing_channels = configured_channels.keys() - current_channels
                     
                     for channel in missing_channels:
-                        self.logger.info(f"Not in configured channel {channel}, attempting to join")
-                        key = configured_channels[channel]
+                        self.logger.info("Not in configured channel %s, attempting to join", channel)
+                        key = configured_channels[channel].get('key', '')
                         self.bot.send_raw(f"JOIN {channel} {key}")
                         
             except Exception as e:
@@ -691,45 +819,45 @@ class MessageHandler:
         # Handle CTCP VERSION request
         if message.startswith('\x01VERSION\x01'):
             version = f"QuipBot v{version} - A witty IRC bot powered by AI - {source_url} - by {author}"
-            self.logger.info(f"Responding to CTCP VERSION request from {nick} ({userhost})")
+            self.logger.info("Responding to CTCP VERSION request from %s (%s)", nick, userhost)
             self.bot.send_raw(f"NOTICE {nick} :\x01VERSION {version}\x01")
             return
         
         # Handle CTCP PING request
         if message.startswith('\x01PING '):
             ping_params = message[6:-1]  # Extract parameters between PING and final \x01
-            self.logger.info(f"Responding to CTCP PING from {nick} ({userhost}) with params: {ping_params}")
+            self.logger.info("Responding to CTCP PING from %s (%s) with params: %s", nick, userhost, ping_params)
             self.bot.send_raw(f"NOTICE {nick} :\x01PING {ping_params}\x01")
             return
         
         # Handle CTCP TIME request
         if message.startswith('\x01TIME\x01'):
-            self.logger.info(f"Received CTCP TIME request from {nick} ({userhost})")
+            self.logger.info("Received CTCP TIME request from %s (%s)", nick, userhost)
             self.bot.send_raw(f"NOTICE {nick} :\x01TIME {time.strftime('%H:%M')} {time.strftime('%Z')} UTC\x01")
             return
         
         # Handle CTCP USERINFO request
         if message.startswith('\x01USERINFO\x01'):
-            self.logger.info(f"Received CTCP USERINFO request from {nick} ({userhost})")
+            self.logger.info("Received CTCP USERINFO request from %s (%s)", nick, userhost)
             self.bot.send_raw(f"NOTICE {nick} :\x01USERINFO {self.bot.current_nick} is a witty AI bot\x01")
             return
         
         # Handle CTCP CLIENTINFO request
         if message.startswith('\x01CLIENTINFO\x01'):
-            self.logger.info(f"Received CTCP CLIENTINFO request from {nick} ({userhost})")
+            self.logger.info("Received CTCP CLIENTINFO request from %s (%s)", nick, userhost)
             supported_commands = "ACTION, CLIENTINFO, PING, TIME, VERSION, USERINFO, SOURCE"
             self.bot.send_raw(f"NOTICE {nick} :\x01CLIENTINFO {supported_commands}\x01")
             return
         
         # Handle CTCP SOURCE request
         if message.startswith('\x01SOURCE\x01'):
-            self.logger.info(f"Received CTCP SOURCE request from {nick} ({userhost})")
+            self.logger.info("Received CTCP SOURCE request from %s (%s)", nick, userhost)
             self.bot.send_raw(f"NOTICE {nick} :\x01SOURCE {source_url}\x01")
             return
         
         # Handle CTCP ACTION request
         if message.startswith('\x01ACTION\x01'):
-            self.logger.info(f"Received CTCP ACTION request from {nick} ({userhost})")
+            self.logger.info("Received CTCP ACTION request from %s (%s)", nick, userhost)
             self.bot.send_raw(f"NOTICE {nick} :\x01ACTION {message[7:-1]}\x01")
             return
         
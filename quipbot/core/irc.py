@@ -12,11 +12,13 @@ from ..utils.ai_client import AIClient
 from ..utils.floodpro import FloodProtection
 from ..utils.tokenbucket import TokenBucket
 from ..utils.logger import setup_logger
+from ..utils.config import SafeLoader, get_config_stat
 import yaml
 import re
 from ..utils.reloader import ModuleReloader
 import signal
 import sys
+import os
 
 def _setup_signal_handlers(bot_instance):
     """Set up signal handlers for the bot.
@@ -40,29 +42,43 @@ def _setup_signal_handlers(bot_instance):
         else:
             bot_instance.logger.error("Failed to complete full reload")
             
+    def handle_sigalrm(signum, frame):
+        """Handle SIGALRM by exiting immediately (shutdown timer set by die)."""
+        os._exit(0)
+            
     # Register signal handlers
     if sys.platform != 'win32':  # Signals not fully supported on Windows
         signal.signal(signal.SIGHUP, handle_sighup)
         signal.signal(signal.SIGUSR1, handle_sigusr1)
-        bot_instance.logger.info("Registered signal handlers for SIGHUP and SIGUSR1")
+        signal.signal(signal.SIGALRM, handle_sigalrm)
+        bot_instance.logger.info("Registered signal handlers for SIGHUP, SIGUSR1 and SIGALRM")
 
 class IRCBot:
-    def __init__(self, config, config_file='config.yaml'):
+    def __init__(self, config, config_file='config.yaml', config_stat=None):
         """Initialize IRC bot."""
         self.config = config
         self.config_file = config_file  # Store the config file path
+        # (mtime_ns, size) of the config file as it was before it was parsed
+        self.config_stat = config_stat if config_stat is not None else self.get_config_stat()
         self.nick = config['nick']
         self.altnick = config.get('altnick', f"{self.nick}_")  # Default to nick_ if not specified
         self.current_nick = self.nick  # Track current nickname
+        self._current_nick_lower = (self.current_nick, self.current_nick.lower())  # (nick, lowered) cache
         self.nick_attempt = 0  # Track nickname attempt number
         self.last_nick_recovery = 0  # Track last time we tried to recover primary nick
         self.realname = config['realname']
         self.ident = config['ident']
         self.servers = config['servers']
+        self.server_index_by_host = self._build_server_index(self.servers)
         self.channels = config['channels']
+        self.channels_by_name = self._build_channel_index(self.channels)
         
         # Sleep tracking
-        self.sleep_until = {}  # {channel: wake_time}
+        self.sleep_until = {}  # {channel_lower: wake_time}
+
+        # Merged channel/global config, cleared whenever the config changes
+        self._merged_channel_configs = {}  # {channel_lower: config}
+        self._ai_delay_ranges = {}  # {channel_lower: (start, end) or None}
         
         # SASL configuration
         self.sasl_config = config.get('sasl', {})
@@ -88,6 +104,7 @@ class IRCBot:
         self.floodpro.logger = self.logger  # Set logger reference
         self.handler = MessageHandler(self)
         self.reloader = ModuleReloader()  # Initialize reloader
+        self.reload_signature = self.reloader.get_source_signature(config_file)  # Files as of the last reload
         
         # Initialize rate limiter
         burst_size = config.get('irc_burst_size', 4)
@@ -97,21 +114,53 @@ class IRCBot:
         # User tracking
         self.users = {}  # {nick: {'account': None, 'host': None}}
         self.channel_users = {}  # {channel: {nick: {'op': False, 'voice': False}}}
+        self.user_channels = {}  # {nick: {channel, ...}} - Reverse index of channel_users
         
         # Timers for random actions - per channel
-        self.last_chat_times = {}  # {channel: timestamp} - When any user last spoke
-        self.last_bot_times = {}   # {channel: timestamp} - When the bot last spoke
-        self.last_action_times = {}  # {channel: timestamp}
-        self.last_check_times = {}  # {channel: timestamp} - When we last checked for conversation
+        # All keyed by lowercased channel name
+        self.last_chat_times = {}  # {channel_lower: timestamp} - When any user last spoke
+        self.last_bot_times = {}   # {channel_lower: timestamp} - When the bot last spoke
+        self.last_action_times = {}  # {channel_lower: timestamp}
+        self.last_check_times = {}  # {channel_lower: timestamp} - When we last checked for conversation
         
         # Conversation continuation tracking
-        self.last_trigger_times = {}  # {channel: timestamp}
-        self.conversation_timers = {}  # {channel: next_response_time}
+        self.last_trigger_times = {}  # {channel_lower: timestamp}
+        self.conversation_timers = {}  # {channel_lower: next_response_time}
         
         # Bot state flags
         self.reload_paused = False  # Controls temporary thread pausing for reloads
         self.connected = False
 
+    def get_config_stat(self):
+        """Get the config file's modification time and size.
+
+        Returns:
+            tuple: (st_mtime_ns, st_size), or None if the file can't be stat'ed
+        """
+        return get_config_stat(self.config_file)
+
+    @staticmethod
+    def _build_channel_index(channels):
+        """Map lowercased channel names to their channel config.
+
+        The first entry wins if a channel is configured more than once.
+        """
+        index = {}
+        for channel in channels:
+            index.setdefault(channel['name'].lower(), channel)
+        return index
+
+    @staticmethod
+    def _build_server_index(servers):
+        """Map lowercased server hosts to their index in the servers list.
+
+        The first entry wins if a host is configured more than once.
+        """
+        index = {}
+        for i, server in enumerate(servers):
+            index.setdefault(server['host'].lower(), i)
+        return index
+
     def _sasl_plain_auth(self):
         """Perform SASL PLAIN authentication."""
         if not self.sasl_config.get('enabled'):
@@ -335,14 +384,32 @@ class IRCBot:
 
     def send_raw(self, message):
         """Send raw message to the IRC server."""
-        self.logger.raw(f">>> {message}")
+        self.send_raw_lines((message,))
+
+    def send_raw_lines(self, messages):
+        """Send several raw messages to the IRC server.
+
+        Messages that the rate limiter allows straight away are written
+        together with a single sendall(). When the limiter asks us to wait,
+        the pending batch is flushed first so no line is held back longer
+        than it would be by send_raw().
+
+        Args:
+            messages: Iterable of raw IRC lines without the trailing CRLF
+        """
         try:
-            # Get token from rate limiter
-            wait_time = self.rate_limiter.get_token()
-            if wait_time > 0:
-                time.sleep(wait_time)
-                
-            self.sock.sendall(f"{message}\r\n".encode('utf-8'))
+            batch = []
+            for message in messages:
+                wait_time = self.rate_limiter.get_token()
+                if wait_time > 0:
+                    if batch:
+                        self.sock.sendall(b''.join(batch))
+                        batch = []
+                    time.sleep(wait_time)
+                self.logger.raw(f">>> {message}")
+                batch.append(f"{message}\r\n".encode('utf-8'))
+            if batch:
+                self.sock.sendall(b''.join(batch))
         except Exception as e:
             self.logger.error(f"Failed to send message: {e}")
             self.reconnect()
@@ -365,13 +432,15 @@ class IRCBot:
         self.conversation_timers[channel.lower()] = time.time() + continue_freq
         self.logger.debug(f"Scheduled next response for {channel} in {continue_freq}s")
 
-    def send_channel_message(self, channel, message, add_to_history=True):
-        """Send a message to a channel.
-        
+    def _split_channel_message(self, channel, message):
+        """Format a channel message and split it into IRC-sized chunks.
+
         Args:
-            channel: The channel to send the message to
-            message: The message to send
-            add_to_history: Whether to add this message to chat history (default: True)
+            channel: The channel the message is for
+            message: The message to split
+
+        Returns:
+            list: Formatted chunks, each fitting in a single PRIVMSG
         """
         # First, normalize newlines and remove any double newlines
         message = ' '.join(message.replace('\r', '').split('\n')).strip()
@@ -382,6 +451,7 @@ class IRCBot:
         # overhead = len("PRIVMSG") + len(channel) + 4
         max_len = 512 - (len("PRIVMSG") + len(channel) + 4)
         
+        chunks = []
         # Split message if too long
         while formatted_message:
             # Find last sentence boundary within limit
@@ -401,33 +471,59 @@ class IRCBot:
                 if split_point == -1:
                     split_point = max_len
                 
-                chunk = formatted_message[:split_point].rstrip()
+                chunks.append(formatted_message[:split_point].rstrip())
                 formatted_message = formatted_message[split_point:].lstrip()
             else:
-                chunk = formatted_message
+                chunks.append(formatted_message)
                 formatted_message = ''
-                
-            try:
-                self.send_raw(f"PRIVMSG {channel} :{chunk}")
-                # Add our own message to the channel history only if requested
-                if add_to_history:
-                    history_entry = f"{self.current_nick}: {chunk}"
-                    # Use lowercase channel name for consistency
-                    channel_lower = channel.lower()
-                    self.ai_client.add_to_history(history_entry, channel_lower)
-                # Update last bot time since we spoke
-                self.last_bot_times[channel.lower()] = time.time()
-                # Schedule next response time
-                if self._should_continue_conversation(channel):
-                    self._schedule_next_response(channel)
-            except Exception as e:
-                self.logger.error(f"Failed to send message to {channel}: {e}")
+        return chunks
+
+    def send_channel_message(self, channel, message, add_to_history=True):
+        """Send a message to a channel.
+        
+        Args:
+            channel: The channel to send the message to
+            message: The message to send
+            add_to_history: Whether to add this message to chat history (default: True)
+        """
+        self.send_channel_messages(channel, [message], add_to_history)
+
+    def send_channel_messages(self, channel, messages, add_to_history=True):
+        """Send several messages to a channel in one batch.
+        
+        Args:
+            channel: The channel to send the messages to
+            messages: The messages to send, in order
+            add_to_history: Whether to add these messages to chat history (default: True)
+        """
+        chunks = []
+        for message in messages:
+            chunks.extend(self._split_channel_message(channel, message))
+        if not chunks:
+            return
+            
+        try:
+            self.send_raw_lines(f"PRIVMSG {channel} :{chunk}" for chunk in chunks)
+            channel_lower = channel.lower()
+            # Add our own messages to the channel history only if requested
+            if add_to_history:
+                for chunk in chunks:
+                    self.ai_client.add_to_history(f"{self.current_nick}: {chunk}", channel_lower)
+            # Update last bot time since we spoke
+            self.last_bot_times[channel_lower] = time.time()
+            # Schedule next response time
+            if self._should_continue_conversation(channel):
+                self._schedule_next_response(channel)
+        except Exception as e:
+            self.logger.error(f"Failed to send message to {channel}: {e}")
 
     def listen_loop(self):
         """Main listening loop for IRC messages."""
         thread = threading.current_thread()
         thread.is_processing = False
-        buffer = ""
+        # Raw bytes, lines are decoded one at a time once complete so a
+        # multi-byte character split across two reads isn't lost
+        buffer = b""
         
         while self.running:  # Check if bot should keep running
             try:
@@ -459,23 +555,27 @@ class IRCBot:
                     time.sleep(0.1)
                     continue
 
-                buffer += data.decode('utf-8', errors='ignore')
-                while '\r\n' in buffer and not self.reload_paused:
-                    line, buffer = buffer.split('\r\n', 1)
+                # Split off every complete line in one go, the last piece is
+                # the start of a line that hasn't fully arrived yet
+                lines = (buffer + data).split(b'\r\n')
+                buffer = lines.pop()
+                for index, raw_line in enumerate(lines):
+                    # Check pause state before each line, keeping the rest for later
+                    if self.reload_paused:
+                        buffer = b'\r\n'.join(lines[index:] + [buffer])
+                        break
+                    line = raw_line.decode('utf-8', errors='ignore')
                     
                     # Log numeric responses that might indicate errors
-                    if ' ' in line and line[0] == ':':
-                        parts = line.split(' ')
-                        if len(parts) >= 2 and parts[1].isdigit():
-                            numeric = int(parts[1])
+                    if line[:1] == ':':
+                        sp1 = line.find(' ')
+                        if sp1 != -1 and line[sp1 + 1:sp1 + 2] in ('4', '5'):
+                            numeric = line[sp1 + 1:].partition(' ')[0]
                             # Log error responses (400-599)
-                            if 400 <= numeric <= 599:
+                            if numeric.isdigit() and 400 <= int(numeric) <= 599:
                                 self.logger.error(f"IRC Error: {line}")
                             
                     self.handler.handle_line(line)
-                    # Check pause state after each line
-                    if self.reload_paused:
-                        break
                     
             except Exception as e:
                 self.logger.error(f"Error in listen loop: {e}")
@@ -620,6 +720,11 @@ class IRCBot:
 
     def is_in_channel(self, channel):
         """Check if the bot is currently in a channel."""
+        # Fast path for the channel name cased as in channel_users
+        users = self.channel_users.get(channel)
+        if users is not None and self.current_nick in users:
+            return True
+            
         # Case insensitive channel check
         channel_lower = channel.lower()
         
@@ -648,7 +753,7 @@ class IRCBot:
                 last_message = channel_history[-1]
                 if ': ' in last_message:
                     last_nick = last_message.split(': ', 1)[0].strip()
-                    is_last = last_nick.lower() == self.current_nick.lower()
+                    is_last = last_nick.lower() == self.get_current_nick_lower()
                     return is_last
             except Exception as e:
                 self.logger.error(f"Error checking last message in {channel}: {e}")
@@ -771,10 +876,11 @@ class IRCBot:
                 recent_users = self.ai_client.get_recent_users(channel_name)
                 
                 # Filter possible targets to only include recently active non-op users
+                current_nick_lower = self.get_current_nick_lower()
                 possible_targets = [
                     nick for nick in recent_users
                     if nick in channel_users  # User is still in channel
-                    and nick.lower() != self.current_nick.lower()  # Not the bot (case insensitive)
+                    and nick.lower() != current_nick_lower  # Not the bot (case insensitive)
                     and not channel_users[nick].get('op', False)  # Not an op
                 ]
                 
@@ -815,6 +921,9 @@ class IRCBot:
         # Update main config
         self.config = new_config
         self.channels = new_config['channels']
+        self.channels_by_name = self._build_channel_index(self.channels)
+        self._merged_channel_configs = {}
+        self._ai_delay_ranges = {}
 
         # Update core bot settings
         self.nick = new_config['nick']
@@ -822,6 +931,7 @@ class IRCBot:
         self.realname = new_config['realname']
         self.ident = new_config['ident']
         self.servers = new_config['servers']
+        self.server_index_by_host = self._build_server_index(self.servers)
 
         # Update component configurations
         self.permissions.update_config(new_config)
@@ -933,11 +1043,7 @@ class IRCBot:
         global_ignores = [n.lower() for n in self.get_channel_config(channel, 'ignore_nicks', [])]
         
         # Get channel-specific ignores
-        channel_config = None
-        for c in self.channels:
-            if isinstance(c, dict) and c.get('name', '').lower() == channel.lower():
-                channel_config = c
-                break
+        channel_config = self.channels_by_name.get(channel_lower)
         
         channel_ignores = [n.lower() for n in channel_config.get('ignore_nicks', [])] if channel_config else []
         
@@ -992,7 +1098,8 @@ class IRCBot:
         self.ai_client.add_to_history(history_entry, channel_lower)
 
         # Update last chat time for any user's message (except our own)
-        if nick.lower() != self.current_nick.lower():
+        current_nick_lower = self.get_current_nick_lower()
+        if nick.lower() != current_nick_lower:
             self.last_chat_times[channel_lower] = time.time()
 
         # If sleeping and not a command, don't process AI responses
@@ -1002,21 +1109,19 @@ class IRCBot:
 
         # Skip if we were the last to speak (unless it's a direct message)
         message_lower = message.lower()
-        is_direct = message_lower.startswith(f"{self.current_nick.lower()}:")
+        is_direct = message_lower.startswith(f"{current_nick_lower}:")
         if not is_direct and self.was_last_speaker(channel):
             self.logger.debug(f"Skipping response in {channel} - bot was last speaker")
             return
 
         # Get AI response delay setting
-        ai_delay_range = self.get_channel_config(channel, 'ai_delay', [0, 0])
-        if isinstance(ai_delay_range, (int, float)):  # Handle old config format
-            ai_delay_range = [ai_delay_range, ai_delay_range]
+        ai_delay_range = self.get_ai_delay_range(channel)
         
         # Calculate random delay if range is set
         ai_delay = 0
-        if ai_delay_range and len(ai_delay_range) == 2 and (ai_delay_range[0] > 0 or ai_delay_range[1] > 0):
+        if ai_delay_range and (ai_delay_range[0] > 0 or ai_delay_range[1] > 0):
             import random
-            ai_delay = random.uniform(ai_delay_range[0], ai_delay_range[1])
+            ai_delay = random.uniform(*ai_delay_range)
 
         # Process direct messages to the bot (nick: message)
         if is_direct:
@@ -1050,7 +1155,7 @@ class IRCBot:
                 return
                 
             # Check for nickname in message with more flexible matching
-            if self.current_nick.lower() in message_lower:
+            if current_nick_lower in message_lower:
                 # Mentions also get a response and update trigger time
                 self._update_trigger_time(channel_lower)
                 
@@ -1090,7 +1195,7 @@ class IRCBot:
         """Get a channel-specific config value, falling back to global config.
         
         Args:
-            channel: The channel name to get config for
+            channel: The channel name to get config for, or None for global
             key: The config key to get
             default: Default value if not found in channel or global config
             
@@ -1099,11 +1204,10 @@ class IRCBot:
             or the default if neither exists.
         """
         # Find channel config - ensure case-insensitive comparison
-        channel_lower = channel.lower()
-        channel_config = next(
-            (c for c in self.channels if c['name'].lower() == channel_lower),
-            None
-        )
+        # No channel (e.g. help text outside a channel) means global only
+        channel_config = None
+        if channel is not None:
+            channel_config = self.channels_by_name.get(channel.lower())
         
         # First check channel-specific override if it exists
         if channel_config is not None:
@@ -1129,6 +1233,56 @@ class IRCBot:
         # Finally fall back to default
         return default
 
+    def get_merged_channel_config(self, channel):
+        """Get the global config with a channel's overrides layered on top.
+
+        The merged dict is built once per channel and reused until the
+        config is next updated. It must be treated as read-only.
+
+        Args:
+            channel: The channel name to get config for
+
+        Returns:
+            dict: Top-level config keys with channel values taking precedence
+        """
+        channel_lower = channel.lower()
+        merged = self._merged_channel_configs.get(channel_lower)
+        if merged is None:
+            merged = dict(self.config)
+            channel_config = self.channels_by_name.get(channel_lower)
+            if channel_config is not None:
+                merged.update(channel_config)
+            self._merged_channel_configs[channel_lower] = merged
+        return merged
+
+    def get_ai_delay_range(self, channel):
+        """Get a channel's ai_delay setting as a (start, end) tuple.
+        
+        A single number (the old config format) becomes (n, n). The result
+        is cached per channel until the config is next updated.
+        
+        Args:
+            channel: The channel name
+            
+        Returns:
+            tuple: (start, end) in seconds, or None if the setting is malformed
+        """
+        channel_lower = channel.lower()
+        try:
+            return self._ai_delay_ranges[channel_lower]
+        except KeyError:
+            pass
+            
+        ai_delay = self.get_channel_config(channel, 'ai_delay', [0, 0])
+        if isinstance(ai_delay, (int, float)):  # Handle old config format
+            delay_range = (ai_delay, ai_delay)
+        elif isinstance(ai_delay, (list, tuple)) and len(ai_delay) == 2:
+            delay_range = tuple(ai_delay)
+        else:
+            delay_range = None
+        self._ai_delay_ranges[channel_lower] = delay_range
+        return delay_range
+
     def get_channel_command_config(self, channel, command):
         """Get channel-specific command configuration.
         
@@ -1143,10 +1297,7 @@ class IRCBot:
         global_cmd_config = self.config.get('commands', {}).get(command, {})
         
         # Get channel-specific command config
-        channel_config = next(
-            (c for c in self.channels if c['name'].lower() == channel.lower()),
-            None
-        )
+        channel_config = self.channels_by_name.get(channel.lower())
         
         # If the command is explicitly configured for this channel, use those settings
         if channel_config and 'commands' in channel_config and command in channel_config['commands']:
@@ -1175,7 +1326,7 @@ class IRCBot:
             bool: True if user is protected, False otherwise
         """
         # Always protect the bot
-        if nick.lower() == self.current_nick.lower():
+        if nick.lower() == self.get_current_nick_lower():
             return True
             
         # Check if user is a channel op
@@ -1198,7 +1349,7 @@ class IRCBot:
         new_nick = params.lstrip(':')
         
         # Track our own nick changes
-        if nick.lower() == self.current_nick.lower():
+        if nick.lower() == self.get_current_nick_lower():
             old_nick = self.current_nick
             self.current_nick = new_nick
             if new_nick == self.nick:
@@ -1221,12 +1372,28 @@ class IRCBot:
                 
         self.logger.debug(f"User {nick} changed nick to {new_nick}")
 
+    def get_current_nick_lower(self):
+        """Get the bot's current nickname in lowercase.
+        
+        The lowered nick is cached alongside the nick it was made from and
+        rebuilt whenever current_nick changes.
+        
+        Returns:
+            str: The lowercased current nickname
+        """
+        current_nick = self.current_nick
+        cached_nick, cached_lower = self._current_nick_lower
+        if cached_nick is not current_nick:
+            cached_lower = current_nick.lower()
+            self._current_nick_lower = (current_nick, cached_lower)
+        return cached_lower
+
     def is_sleeping(self, channel):
         """Check if the bot is currently sleeping in a channel."""
         channel_lower = channel.lower()
-        if channel_lower in self.sleep_until:
-            now = time.time()
-            if now >= self.sleep_until[channel_lower]:
+        wake_time = self.sleep_until.get(channel_lower)
+        if wake_time is not None:
+            if time.time() >= wake_time:
                 # Sleep time has expired, wake up
                 del self.sleep_until[channel_lower]
                 self.logger.info(f"Bot automatically woke up in {channel}")
@@ -1334,9 +1501,11 @@ class IRCBot:
     def reload_config(self):
         """Reload configuration from file."""
         try:
-            with open(self.config_file, 'r') as f:
-                new_config = yaml.safe_load(f)
+            config_stat = self.get_config_stat()
+            with open(self.config_file, 'rb') as f:
+                new_config = yaml.load(f.read(), Loader=SafeLoader)
             self.update_config(new_config)
+            self.config_stat = config_stat
             return True
         except Exception as e:
             self.logger.error(f"Failed to reload configuration: {e}")
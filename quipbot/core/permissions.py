@@ -2,11 +2,39 @@
 
 import fnmatch
 import logging
+import re
 from collections import defaultdict
+from functools import lru_cache
 import time
 
 logger = logging.getLogger('QuipBot')
 
+@lru_cache(maxsize=256)
+def _compile_mask(pattern):
+    """Compile an IRC-style mask pattern into a case-insensitive regex.
+    
+    Compiled patterns are memoized, so admin checks that miss the admin
+    cache don't rebuild the regex for every configured mask.
+    
+    Raises:
+        re.error: If the resulting pattern is invalid
+    """
+    # Convert IRC-style pattern to regex
+    # 1. Escape special regex chars except * and ?
+    special_chars = '.+^$[](){}|\\'
+    regex_pattern = ''.join('\\' + c if c in special_chars else c for c in pattern)
+    
+    # 2. Convert * to match anything (including ! and @)
+    regex_pattern = regex_pattern.replace('*', '.*?')
+    
+    # 3. Convert ? to match single character
+    regex_pattern = regex_pattern.replace('?', '.')
+    
+    # 4. Add start/end anchors
+    regex_pattern = f"^{regex_pattern}$"
+    
+    return re.compile(regex_pattern, re.IGNORECASE)
+
 class PermissionManager:
     def __init__(self, config):
         """Initialize permission manager."""
@@ -71,8 +99,9 @@ class PermissionManager:
         # Check cache first
         cache_key = (nick.lower(), userhost.lower())
         now = time.time()
-        if cache_key in self.admin_cache:
-            result, timestamp = self.admin_cache[cache_key]
+        cached = self.admin_cache.get(cache_key)
+        if cached is not None:
+            result, timestamp = cached
             if now - timestamp < self.cache_ttl:
                 return result
             else:
@@ -132,24 +161,8 @@ class PermissionManager:
         
     def _match_mask(self, mask, pattern):
         """Match a mask against a pattern, supporting IRC-style wildcards."""
-        # Convert IRC-style pattern to regex
-        # 1. Escape special regex chars except * and ?
-        special_chars = '.+^$[](){}|\\'
-        regex_pattern = ''.join('\\' + c if c in special_chars else c for c in pattern)
-        
-        # 2. Convert * to match anything (including ! and @)
-        regex_pattern = regex_pattern.replace('*', '.*?')
-        
-        # 3. Convert ? to match single character
-        regex_pattern = regex_pattern.replace('?', '.')
-        
-        # 4. Add start/end anchors
-        regex_pattern = f"^{regex_pattern}$"
-        
-        # Try to match
         try:
-            import re
-            return bool(re.match(regex_pattern, mask, re.IGNORECASE))
+            return bool(_compile_mask(pattern).match(mask))
         except re.error as e:
             self.logger.error(f"Invalid pattern '{pattern}': {e}")
             return False
@@ -1,14 +1,32 @@
 """Configuration management for QuipBot."""
 
+import os
 import yaml
 from pathlib import Path
 
+# Prefer the LibYAML C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+def get_config_stat(config_path="config.yaml"):
+    """Get the details used to tell whether a config file has changed.
+
+    Returns:
+        tuple: (st_mtime_ns, st_size), or None if the file can't be stat'ed
+    """
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 def load_config(config_path="config.yaml"):
     """Load configuration from YAML file."""
     try:
-        with open(config_path, 'r') as config_file:
-            config = yaml.safe_load(config_file)
-        return config
+        with open(config_path, 'rb') as config_file:
+            return yaml.load(config_file.read(), Loader=SafeLoader)
     except Exception as e:
         raise Exception(f"Failed to load configuration: {e}")
 
@@ -18,4 +36,4 @@ def save_config(config, config_path="config.yaml"):
         with open(config_path, 'w') as config_file:
             yaml.dump(config, config_file, default_flow_style=False)
     except Exception as e:
-        raise Exception(f"Failed to save configuration: {e}") 
\ No newline at end of file
+        raise Exception(f"Failed to save configuration: {e}")
\ No newline at end of file
@@ -169,13 +169,20 @@ class ColoredFormatter(logging.Formatter):
         if not self.use_colors:
             return super().format(record_copy)
 
+        # Merge any %-style arguments first so event keywords passed as
+        # arguments are matched too
+        message = record_copy.getMessage()
+        record_copy.msg = message
+        record_copy.args = None
+
         # Get level style
         level_style = LEVEL_STYLES.get(record_copy.levelname, {'color': '', 'emoji': ''})
         
         # Check for specific events in the message
         event_style = None
+        message_lower = message.lower()
         for event, style in EVENT_STYLES.items():
-            if event.lower() in record_copy.msg.lower():
+            if event.lower() in message_lower:
                 event_style = style
                 break
         
@@ -187,9 +194,9 @@ class ColoredFormatter(logging.Formatter):
         
         # Special handling for RAW messages to distinguish incoming/outgoing
         if record_copy.levelname == 'RAW':
-            if record_copy.msg.startswith('>>>'):
+            if message.startswith('>>>'):
                 color = COLORS['BRIGHT_MAGENTA']  # Outgoing messages
-            elif record_copy.msg.startswith('<<<'):
+            elif message.startswith('<<<'):
                 color = COLORS['INDIGO']  # Incoming messages
 
         # Format the level name with padding for alignment
@@ -197,7 +204,7 @@ class ColoredFormatter(logging.Formatter):
         record_copy.levelname = f"{color}{record_copy.levelname}{padding} - "
         
         # Format the message with emoji and color the entire line
-        record_copy.msg = f"{emoji}  {record_copy.msg}{COLORS['RESET']}"
+        record_copy.msg = f"{emoji}  {message}{COLORS['RESET']}"
         
         return super().format(record_copy)
 
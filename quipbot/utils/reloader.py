@@ -1,5 +1,6 @@
 """Module reloading system for QuipBot."""
 
+import os
 import sys
 import types
 import importlib
@@ -45,6 +46,35 @@ class ModuleReloader:
         # Keep reference to logger
         self.logger = logger
         
+    def get_source_signature(self, config_file: str = None) -> Tuple[Tuple[str, int], ...]:
+        """Fingerprint the QuipBot sources and config file by modification time.
+        
+        Args:
+            config_file: Optional path of the config file to include
+            
+        Returns:
+            tuple: Sorted (path, st_mtime_ns) pairs, changes if any file is
+                   added, removed or modified
+        """
+        entries = []
+        pending = [str(Path(__file__).resolve().parent.parent)]
+        while pending:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != '__pycache__':
+                            pending.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        entries.append((entry.path, entry.stat().st_mtime_ns))
+                        
+        if config_file:
+            try:
+                entries.append((config_file, os.stat(config_file).st_mtime_ns))
+            except OSError:
+                pass
+                
+        return tuple(sorted(entries))
+
     def _analyze_imports(self, module_path: str) -> Set[str]:
         """Analyze module imports using AST.
         
@@ -125,13 +155,13 @@ class ModuleReloader:
                         dependencies.add(obj.__name__)
                         
                 # Check class inheritance
-                elif inspect.isclass(obj):
+                elif isinstance(obj, type):
                     for base in obj.__bases__:
                         if hasattr(base, '__module__') and base.__module__.startswith('quipbot'):
                             dependencies.add(base.__module__)
                             
                 # Check function references
-                elif inspect.isfunction(obj):
+                elif isinstance(obj, types.FunctionType):
                     # Get module references from function's global namespace
                     for ref_name, ref_obj in obj.__globals__.items():
                         if (isinstance(ref_obj, types.ModuleType) and 